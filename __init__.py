@@ -56,4 +56,6 @@ def alphabetize_app_menus(env):
 
 
 def _post_init_hook(env):
-    alphabetize_app_menus(env)
\ No newline at end of file
+    alphabetize_app_menus(env)
+    env["elks.member.milestone"]._rebuild_calendar()
+    env["elks.membership.snapshot"]._rebuild_snapshots()
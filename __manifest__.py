@@ -1,6 +1,6 @@
 {
     "name": "Elks Contacts",
-    "version": "19.0.4.3",
+    "version": "19.0.4.9",
     "category": "Contacts",
     "summary": "Manage Elks Member Contact Information",
     "author": "Danny Santiago",
@@ -10,6 +10,7 @@
     "data": [
         "security/elks_groups.xml",
         "security/ir.model.access.csv",
+        "security/elks_security.xml",
         "wizard/ballot_wizard_views.xml",
         "wizard/employee_merge_wizard_views.xml",
         "wizard/initiate_wizard_views.xml",
@@ -19,6 +20,8 @@
         "wizard/drop_wizard_views.xml",
         "wizard/transfer_dimit_wizard_views.xml",
         "wizard/vacate_officer_wizard_views.xml",
+        "wizard/officer_slate_copy_wizard_views.xml",
+        "wizard/officer_history_import_wizard_views.xml",
         "wizard/clms_import_wizard_views.xml",
         "views/elks_contact_views.xml",
         "views/elks_action.xml",
@@ -35,7 +38,12 @@
         "views/elks_charitable_views.xml",
         "views/elks_membership_application_views.xml",
         "views/elks_menus.xml",
+        "views/elks_member_milestone_views.xml",
+        "views/elks_dues_aging_report_views.xml",
+        "views/elks_membership_snapshot_views.xml",
         "wizard/officer_poster_wizard_views.xml",
+        "views/elks_officer_poster_job_views.xml",
+        "wizard/officer_card_wizard_views.xml",
         "views/website_officers.xml",
         "report/officer_roster_report.xml",
         "report/proposed_members_report.xml",
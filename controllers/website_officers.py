@@ -3,28 +3,68 @@
 
 Provides an explicit /contactus route that renders the standard
 ``website.contactus`` template with officer term data added to the
-rendering context.  The inherited QWeb template
-(``elkscontacts.website_officers_contactus``) picks up the extra
-variables and renders the officers section above the contact form.
+rendering context.  The officers section itself
+(``elkscontacts.website_officers_section``) is rendered once per lodge
+year and cached as an HTML fragment; the inherited QWeb template
+(``elkscontacts.website_officers_contactus``) drops it in above the
+contact form.
+
+/contactus is the most-crawled URL on the site, so the fragment cache
+is keyed on ``elks.officer.term._website_cache_stamp`` (term count +
+last term / partner write): any officer or member name change produces
+a new key in every worker without explicit invalidation.  Only the
+fragment is cached.  The page itself carries the contact form's
+per-session CSRF token and the company / website details, so it is
+always rendered fresh and sent ``private, no-cache``.
+
+``/elkscontacts/officers.json`` exposes the same officer data as JSON
+for lobby displays and the lodge's static site, cached on the same
+stamp with ETag / If-None-Match support.
 """
+import hashlib
+import json
+from collections import OrderedDict
+from functools import lru_cache
+
 from odoo import fields as odoo_fields, http
 from odoo.http import request
+from odoo.tools.image import image_process
+from odoo.tools.misc import file_path
+
+from ..models.elks_lodge_year import current_lodge_year
+from ..models.elks_officer_term import PHOTO_SIZES
+
+#: Rendered officer sections, keyed by (db, website, lang, stamp).
+_SECTION_CACHE = OrderedDict()
+_SECTION_CACHE_SIZE = 32
+
+#: Serialized officers.json bodies, keyed by (db, host, lang, stamp).
+_JSON_CACHE = OrderedDict()
+_JSON_CACHE_SIZE = 16
+
+#: Polling displays may reuse officers.json this long (seconds).
+OFFICERS_JSON_MAX_AGE = 30
+
+#: Bundled fallback portraits, by officer gender.
+AVATAR_GENDERS = ('male', 'female')
+
+
+@lru_cache(maxsize=len(AVATAR_GENDERS) * len(PHOTO_SIZES))
+def _avatar_derivative(gender, size):
+    """Resize a bundled Elk avatar once per process, through the same
+    ``image_process`` pipeline Odoo uses for stored image fields."""
+    path = file_path('elkscontacts/static/img/elk_avatar_%s.png' % gender)
+    with open(path, 'rb') as f:
+        return image_process(f.read(), size=(size, size))
 
 
 class WebsiteOfficers(http.Controller):
 
-    @http.route('/contactus', type='http', auth='public', website=True, sitemap=True)
-    def contactus_with_officers(self, **kwargs):
-        """Serve the Contact Us page with officer data in context."""
+    def _officer_groups(self, current_year):
+        """Return the current year's website officers as
+        ``(er_officer, ordered_groups, position_labels)``."""
         OfficerTerm = request.env['elks.officer.term'].sudo()
 
-        # Determine current lodge year
-        today = odoo_fields.Date.today()
-        if today.month >= 4:
-            current_year = f"{today.year}-{today.year + 1}"
-        else:
-            current_year = f"{today.year - 1}-{today.year}"
-
         # Fetch officers for the current year, visible on website
         officers = OfficerTerm.search([
             ('lodge_year', '=', current_year),
@@ -70,10 +110,122 @@ class WebsiteOfficers(http.Controller):
         for t in type_order:
             if t in grouped:
                 ordered_groups.append(grouped[t])
+        return er_officer, ordered_groups, position_labels
+
+    @http.route('/elkscontacts/avatar/<string:gender>/<int:size>',
+                type='http', auth='public', sitemap=False)
+    def officer_avatar(self, gender, size, **kwargs):
+        """Serve a resized Elk avatar for officers without a photo."""
+        if gender not in AVATAR_GENDERS or size not in PHOTO_SIZES:
+            return request.not_found()
+        return request.make_response(_avatar_derivative(gender, size), [
+            ('Content-Type', 'image/png'),
+            ('Cache-Control', 'public, max-age=604800'),
+        ])
+
+    def _officer_json_entry(self, officer, position_labels, type_labels,
+                            host_url):
+        """Public fields of one officer term for officers.json.  Vacant
+        seats keep their position but drop the former holder."""
+        vacant = officer.x_is_vacated
+        photo = None if vacant else \
+            host_url + officer._website_photo_urls(128)['src']
+        return {
+            'position': officer.position,
+            'label': position_labels.get(officer.position, officer.position),
+            'type': officer.officer_type or None,
+            'type_label': type_labels.get(officer.officer_type),
+            'name': None if vacant else officer.partner_id.name,
+            'email': None if vacant else (officer.officer_email or None),
+            'phone': None if vacant else (officer.officer_phone or None),
+            'photo_url': photo,
+            'vacant': bool(vacant),
+        }
 
-        return request.render('website.contactus', {
-            'er_officer': er_officer,
-            'officers_groups': ordered_groups,
-            'officers_position_labels': position_labels,
+    def _officers_json_body(self, current_year, stamp):
+        """Return ``(body, etag)`` for officers.json, from cache when the
+        officer data hasn't changed."""
+        host_url = request.httprequest.host_url.rstrip('/')
+        key = (request.env.cr.dbname, host_url, request.env.lang, stamp)
+        cached = _JSON_CACHE.get(key)
+        if cached is not None:
+            _JSON_CACHE.move_to_end(key)
+            return cached
+        er_officer, ordered_groups, position_labels = \
+            self._officer_groups(current_year)
+        type_labels = dict(request.env['elks.officer.term']
+                           ._fields['officer_type'].selection)
+        officers = ([er_officer] if er_officer else []) + [
+            officer for group in ordered_groups
+            for officer in group['officers']
+        ]
+        body = json.dumps({
+            'lodge_year': current_year,
+            'officers': [
+                self._officer_json_entry(
+                    officer, position_labels, type_labels, host_url)
+                for officer in officers
+            ],
+        }, ensure_ascii=False).encode()
+        cached = (body, hashlib.sha1(body).hexdigest())
+        _JSON_CACHE[key] = cached
+        while len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+            _JSON_CACHE.popitem(last=False)
+        return cached
+
+    @http.route('/elkscontacts/officers.json', type='http', auth='public',
+                methods=['GET'], cors='*', sitemap=False)
+    def officers_json(self, **kwargs):
+        """Current lodge year's website officers as JSON (read-only)."""
+        current_year = current_lodge_year(odoo_fields.Date.today())
+        stamp = request.env['elks.officer.term'].sudo() \
+            ._website_cache_stamp(current_year)
+        body, etag = self._officers_json_body(current_year, stamp)
+        headers = [
+            ('Cache-Control',
+             'public, max-age=%d, must-revalidate' % OFFICERS_JSON_MAX_AGE),
+        ]
+        if etag in request.httprequest.if_none_match:
+            response = request.make_response('', headers, status=304)
+        else:
+            response = request.make_response(
+                body, headers + [('Content-Type', 'application/json')])
+        response.set_etag(etag)
+        return response
+
+    def _officers_section_html(self, current_year, stamp):
+        """Return the rendered officers section, from cache when the
+        officer data hasn't changed since it was last rendered."""
+        key = (request.env.cr.dbname, request.website.id,
+               request.env.lang, stamp)
+        html = _SECTION_CACHE.get(key)
+        if html is not None:
+            _SECTION_CACHE.move_to_end(key)
+            return html
+        er_officer, ordered_groups, position_labels = \
+            self._officer_groups(current_year)
+        html = request.env['ir.qweb']._render(
+            'elkscontacts.website_officers_section', {
+                'er_officer': er_officer,
+                'officers_groups': ordered_groups,
+                'officers_position_labels': position_labels,
+                'officers_current_year': current_year,
+            })
+        _SECTION_CACHE[key] = html
+        while len(_SECTION_CACHE) > _SECTION_CACHE_SIZE:
+            _SECTION_CACHE.popitem(last=False)
+        return html
+
+    @http.route('/contactus', type='http', auth='public', website=True, sitemap=True)
+    def contactus_with_officers(self, **kwargs):
+        """Serve the Contact Us page with officer data in context."""
+        current_year = current_lodge_year(odoo_fields.Date.today())
+        stamp = request.env['elks.officer.term'].sudo() \
+            ._website_cache_stamp(current_year)
+        response = request.render('website.contactus', {
+            'officers_section_html': self._officers_section_html(
+                current_year, stamp),
             'officers_current_year': current_year,
         })
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Pre-migration: backfill the newly stored member statistics in SQL.
+
+``x_age``, ``x_member_years`` and ``x_years_as_per/pey/poy`` on
+``res.partner`` changed from non-stored to stored computed fields.
+Left alone, the ORM would create the columns and recompute every
+partner row in Python during the upgrade.  Creating and filling the
+columns here means the ORM finds them already present and skips the
+recompute.  The nightly ``cron_refresh_member_stats`` job keeps them
+current from then on, starting from today's date.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+_HONOR_COLUMNS = [
+    ('x_years_as_per', 'x_detail_per_start_year'),
+    ('x_years_as_pey', 'x_detail_pey_start_year'),
+    ('x_years_as_poy', 'x_detail_poy_start_year'),
+]
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    cr.execute("""
+        ALTER TABLE res_partner
+        ADD COLUMN IF NOT EXISTS x_age INTEGER,
+        ADD COLUMN IF NOT EXISTS x_member_years INTEGER,
+        ADD COLUMN IF NOT EXISTS x_years_as_per INTEGER,
+        ADD COLUMN IF NOT EXISTS x_years_as_pey INTEGER,
+        ADD COLUMN IF NOT EXISTS x_years_as_poy INTEGER
+    """)
+
+    cr.execute("""
+        UPDATE res_partner
+           SET x_age = CASE
+                   WHEN x_date_of_birth IS NULL THEN 0
+                   ELSE GREATEST(0, date_part(
+                       'year', age(CURRENT_DATE, x_date_of_birth))::int)
+               END,
+               x_member_years = CASE
+                   WHEN x_date_initiated IS NULL THEN 0
+                   ELSE GREATEST(0, date_part(
+                       'year', age(CURRENT_DATE, x_date_initiated))::int
+                       - COALESCE(x_lost_years, 0))
+               END
+    """)
+    _logger.info(
+        "Pre-migrate 19.0.4.4: filled x_age / x_member_years on %d "
+        "partner(s).", cr.rowcount,
+    )
+
+    for target, source in _HONOR_COLUMNS:
+        cr.execute(f"""
+            UPDATE res_partner
+               SET {target} = CASE
+                       WHEN btrim({source}) ~ '^[0-9]+$'
+                       THEN GREATEST(0, date_part('year', CURRENT_DATE)::int
+                                        - btrim({source})::int)
+                       ELSE 0
+                   END
+        """)
+
+    # The columns are current as of today — the nightly refresh only
+    # needs to pick up rollovers from tomorrow onward.
+    cr.execute("""
+        INSERT INTO ir_config_parameter (key, value)
+        VALUES ('elkscontacts.member_stats_last_run', CURRENT_DATE::text)
+        ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value
+    """)
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""19.0.4.5 — Populate the member milestone calendar.
+
+``elks.member.milestone`` is new in this version.  Fill it from the
+existing birthday / initiation / anniversary dates on res.partner in
+one SQL pass; res.partner create/write keeps it current afterwards.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    from odoo import api, SUPERUSER_ID
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    count = env['elks.member.milestone']._rebuild_calendar()
+    _logger.info(
+        "Post-migrate 19.0.4.5: indexed %d member milestone(s).", count,
+    )
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""19.0.4.6 — Backfill stored lodge-year columns in SQL.
+
+Lodge-year logic now lives in ``models/elks_lodge_year.py``.  Make sure
+every stored ``lodge_year`` column derived from a date agrees with it,
+using one UPDATE per table instead of an ORM recompute.  Only rows whose
+value is wrong are touched.
+"""
+import logging
+
+from odoo.addons.elkscontacts.models.elks_lodge_year import backfill_lodge_year
+
+_logger = logging.getLogger(__name__)
+
+# (table, date column) pairs with a stored computed lodge_year
+_LODGE_YEAR_COLUMNS = [
+    ('elks_membership_application', 'date_proposed'),
+    ('elks_charitable_activity', 'date'),
+]
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    for table, date_column in _LODGE_YEAR_COLUMNS:
+        count = backfill_lodge_year(cr, table, date_column)
+        _logger.info(
+            "Post-migrate 19.0.4.6: corrected lodge_year on %d %s row(s).",
+            count, table,
+        )
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""19.0.4.7 — Build the per-lodge-year membership snapshots.
+
+``elks.membership.snapshot`` is new in this version.  Tally the gains
+and losses already in elks_member_history in one grouped INSERT;
+history create/write/unlink keeps the rows current afterwards.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    from odoo import api, SUPERUSER_ID
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    count = env['elks.membership.snapshot']._rebuild_snapshots()
+    _logger.info(
+        "Post-migrate 19.0.4.7: built %d membership snapshot row(s).", count,
+    )
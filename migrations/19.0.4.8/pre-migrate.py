@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Pre-migration: backfill ``elks.officer.term.image_checksum`` in SQL.
+
+The new stored checksum is the SHA-1 of the term's photo, which the
+filestore already keeps for every attachment (``ir_attachment.checksum``
+is the SHA-1 of the raw file).  Copying it here means the ORM finds the
+column filled and doesn't read and hash every officer photo during the
+upgrade.  The new ``image_1024`` derivative is attachment-backed, so
+the upgrade doesn't compute it; the 19.0.4.9 post-migrate does.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    cr.execute("""
+        ALTER TABLE elks_officer_term
+        ADD COLUMN IF NOT EXISTS image_checksum VARCHAR
+    """)
+    cr.execute("""
+        UPDATE elks_officer_term t
+           SET image_checksum = a.checksum
+          FROM ir_attachment a
+         WHERE a.res_model = 'elks.officer.term'
+           AND a.res_field = 'image_1920'
+           AND a.res_id = t.id
+    """)
+    _logger.info(
+        "Pre-migrate 19.0.4.8: copied the photo checksum of %d officer "
+        "term(s).", cr.rowcount,
+    )
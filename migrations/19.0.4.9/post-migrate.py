@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""19.0.4.9 — Resize the stored officer photo derivatives.
+
+``image_1024`` / ``image_512`` / ``image_256`` / ``image_128`` on
+``elks.officer.term`` are stored related images kept as attachments,
+not columns, so the upgrades that added them never computed them for
+existing terms (the ORM only recomputes existing rows when it creates
+a column).  Mark
+every term with a photo for recompute and flush, in batches so only a
+batch of photos is decoded at a time.
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+#: Stored derivatives of ``image_1920`` to (re)build.
+_DERIVATIVES = ['image_1024', 'image_512', 'image_256', 'image_128']
+BATCH_SIZE = 200
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    from odoo import api, SUPERUSER_ID
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    Term = env['elks.officer.term'].with_context(active_test=False)
+
+    cr.execute("""
+        SELECT res_id
+          FROM ir_attachment
+         WHERE res_model = 'elks.officer.term'
+           AND res_field = 'image_1920'
+           AND res_id IS NOT NULL
+         ORDER BY res_id
+    """)
+    ids = [row[0] for row in cr.fetchall()]
+    for i in range(0, len(ids), BATCH_SIZE):
+        terms = Term.browse(ids[i:i + BATCH_SIZE]).exists()
+        for name in _DERIVATIVES:
+            env.add_to_compute(Term._fields[name], terms)
+        Term.flush_model(_DERIVATIVES)
+        env.invalidate_all()
+    _logger.info(
+        "Post-migrate 19.0.4.9: rebuilt photo derivatives of %d officer "
+        "term(s).", len(ids),
+    )
@@ -1,11 +1,15 @@
 from . import elks_contact
 from . import elks_officer_term
+from . import elks_officer_poster_job
 from . import elks_volunteer_training
 from . import elks_committee
 from . import elks_charitable
+from . import elks_dues_aging_report
 from . import hr_employee
 from . import res_user
 from . import elks_member_history
+from . import elks_membership_snapshot
+from . import elks_member_milestone
 from . import elks_membership_application
 from . import base_import_flex
 from . import elks_member_clms_tabs
\ No newline at end of file
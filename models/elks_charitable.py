@@ -8,6 +8,8 @@ ENF, etc.) with hours and dollars separated.
 """
 from odoo import api, fields, models
 
+from .elks_lodge_year import compute_lodge_years
+
 
 CHARITY_CATEGORIES = [
     ('scholarship', 'Scholarships'),
@@ -103,15 +105,7 @@ class ElksCharitableActivity(models.Model):
 
     @api.depends("date")
     def _compute_lodge_year(self):
-        for rec in self:
-            if rec.date:
-                if rec.date.month >= 4:
-                    start = rec.date.year
-                else:
-                    start = rec.date.year - 1
-                rec.lodge_year = f"{start}-{start + 1}"
-            else:
-                rec.lodge_year = False
+        compute_lodge_years(self, "date")
 
     @api.depends("cash_donated", "goods_value")
     def _compute_totals(self):
@@ -2,32 +2,23 @@
 # Copyright (C) 2025
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0.en.html)
 
-from datetime import date
-
 from dateutil.relativedelta import relativedelta
 
 from odoo import api, fields, models, _
 from odoo.exceptions import AccessError, UserError, ValidationError
 
+from .elks_lodge_year import current_lodge_year_start
+from .elks_member_milestone import MILESTONE_SOURCE_FIELDS
+
 import logging
 
 _logger = logging.getLogger(__name__)
 
-
-def _current_lodge_year_start(today=None):
-    """Return April 1 of the current lodge year.
-
-    The Elks lodge year runs April 1 – March 31.
-    If today is Jan–Mar, we're still in the previous lodge year
-    (started April 1 of last calendar year).
-    If today is Apr–Dec, the current lodge year started April 1 of this year.
-    """
-    if today is None:
-        today = date.today()
-    if today.month >= 4:
-        return date(today.year, 4, 1)
-    else:
-        return date(today.year - 1, 4, 1)
+#: Context value marking partner writes whose officer-position check the
+#: caller runs itself once the whole batch is written (see
+#: ``_defer_officer_check``).  A module-level object rather than a flag,
+#: so it can't be passed in over RPC to skip the check.
+_DEFER_OFFICER_CHECK = object()
 
 
 class ResPartner(models.Model):
@@ -196,21 +187,24 @@ class ResPartner(models.Model):
     )
 
     # Computed years of service for PER / PEY / POY
-    # NOT stored — avoids DB column creation issues during upgrade
-    # and these are trivial subtractions, no performance concern.
+    # Stored + indexed so "PERs with 10+ years" is a plain SQL filter.
+    # The values depend on today's date, so cron_refresh_member_stats
+    # re-runs the compute every January 1 (see below); the 19.0.4.4
+    # pre-migration fills the columns in SQL so the upgrade does not
+    # recompute every partner through the ORM.
     x_years_as_per = fields.Integer(
         "Years as PER",
-        compute="_compute_honor_years",
+        compute="_compute_honor_years", store=True, index=True,
         help="Number of years since becoming a Past Exalted Ruler.",
     )
     x_years_as_pey = fields.Integer(
         "Years as PEY",
-        compute="_compute_honor_years",
+        compute="_compute_honor_years", store=True, index=True,
         help="Number of years since receiving PEY recognition.",
     )
     x_years_as_poy = fields.Integer(
         "Years as POY",
-        compute="_compute_honor_years",
+        compute="_compute_honor_years", store=True, index=True,
         help="Number of years since receiving POY recognition.",
     )
 
@@ -518,7 +512,7 @@ class ResPartner(models.Model):
     @api.depends('x_detail_per_start_year', 'x_detail_pey_start_year',
                  'x_detail_poy_start_year')
     def _compute_honor_years(self):
-        current_year = date.today().year
+        current_year = fields.Date.context_today(self).year
         for rec in self:
             for yr_field, count_field in [
                 ('x_detail_per_start_year', 'x_years_as_per'),
@@ -547,41 +541,78 @@ class ResPartner(models.Model):
         silently clear their stale field and allow the new assignment.
         Prevents the "Only one member can be ..." block on legitimate
         backfills after a mid-term vacancy.
+
+        One query covers every position in the recordset: it lists the
+        other active partners showing those positions together with
+        whether each still has an active, non-vacated current-year term
+        for it.  Stale holders are cleared in one write that skips this
+        check, so nothing recurses.
         """
-        Term = self.env.get('elks.officer.term')
-        for rec in self:
+        # Bulk officer-term sync writes several groups of partners and
+        # then runs this check once over all of them.
+        if self.env.context.get('elks_defer_officer_check') \
+                is _DEFER_OFFICER_CHECK:
+            return
+        recs = self.filtered('x_elks_officer_position')
+        if not recs:
+            return
+        Term = self.env['elks.officer.term']
+        self.flush_model(['x_elks_officer_position', 'active'])
+        Term.flush_model([
+            'partner_id', 'position', 'lodge_year', 'active', 'x_is_vacated',
+        ])
+        self.env.cr.execute(f"""
+            SELECT p.id, p.x_elks_officer_position,
+                   EXISTS (
+                       SELECT 1
+                         FROM {Term._table} t
+                        WHERE t.partner_id = p.id
+                          AND t.position = p.x_elks_officer_position
+                          AND t.lodge_year = %s
+                          AND t.active
+                          AND NOT COALESCE(t.x_is_vacated, false)
+                   ) AS still_holds
+              FROM res_partner p
+             WHERE p.x_elks_officer_position IN %s
+               AND p.active
+             ORDER BY p.id
+        """, (
+            Term.get_current_lodge_year(),
+            tuple(set(recs.mapped('x_elks_officer_position'))),
+        ))
+        holders = {}
+        for partner_id, pos, still_holds in self.env.cr.fetchall():
+            holders.setdefault(pos, []).append((partner_id, still_holds))
+
+        batch_ids = set(recs.ids)
+        stale_ids = set()
+        for rec in recs:
             pos = rec.x_elks_officer_position
-            if not pos:
-                continue
-            others = self.search([
-                ('id', '!=', rec.id),
-                ('x_elks_officer_position', '=', pos),
-            ])
-            for other in others:
-                # Self-heal: check whether `other` actually still has
-                # an active non-vacated term for this position. If not,
-                # their partner-side field is stale — clear it and
-                # move on instead of blocking.
-                still_holds = False
-                if Term is not None:
-                    active_terms = Term.search([
-                        ('partner_id', '=', other.id),
-                        ('position', '=', pos),
-                        ('active', '=', True),
-                        ('x_is_vacated', '=', False),
-                    ], limit=1)
-                    still_holds = bool(active_terms)
-                if not still_holds:
-                    other.sudo().write({
-                        'x_elks_officer_position': False,
-                    })
+            for other_id, still_holds in holders.get(pos, []):
+                if other_id == rec.id or other_id in stale_ids:
+                    continue
+                # Self-heal: `other` shows the position but no longer
+                # holds a current term for it — clear it instead of
+                # blocking.  Partners in this batch are being assigned
+                # on purpose, so they are never cleared here.
+                if not still_holds and other_id not in batch_ids:
+                    stale_ids.add(other_id)
                     continue
                 label = dict(
                     self._fields['x_elks_officer_position'].selection,
                 ).get(pos, pos)
                 raise ValidationError(_(
                     "Only one member can be '%s'. Current holder: %s"
-                ) % (label, other.display_name))
+                ) % (label, self.browse(other_id).display_name))
+        if stale_ids:
+            self.browse(list(stale_ids)).sudo()._defer_officer_check().write(
+                {'x_elks_officer_position': False})
+
+    def _defer_officer_check(self):
+        """Return ``self`` with ``_check_unique_officer_position``
+        skipped on write; the caller runs it once over everything it
+        changed."""
+        return self.with_context(elks_defer_officer_check=_DEFER_OFFICER_CHECK)
 
     # ==========================================
     # Volunteer ↔ HR Employee sync
@@ -692,6 +723,11 @@ class ResPartner(models.Model):
                         rec.x_volunteer_employee_id.id, rec.id,
                     )
 
+    def _sync_member_milestones(self):
+        """Refresh this contact's rows in the milestone calendar
+        (birthday, initiation / wedding anniversary, spouse birthday)."""
+        self.env['elks.member.milestone']._sync_partners(self)
+
     def action_open_volunteer_link_wizard(self):
         """Open the Link / Create Employee wizard for this contact."""
         self.ensure_one()
@@ -802,6 +838,11 @@ class ResPartner(models.Model):
         if volunteers:
             volunteers._sync_volunteer_employee()
 
+        # Index birthdays / anniversaries in the milestone calendar
+        if any(f in vals for vals in vals_list
+               for f in MILESTONE_SOURCE_FIELDS.values()):
+            touched._sync_member_milestones()
+
         return touched
 
     def write(self, vals):
@@ -833,6 +874,10 @@ class ResPartner(models.Model):
         if 'x_is_volunteer' in vals:
             self._sync_volunteer_employee()
 
+        # Keep the milestone calendar in step with the source dates
+        if any(f in vals for f in MILESTONE_SOURCE_FIELDS.values()):
+            self._sync_member_milestones()
+
         # Mirror x_spouse_id on the other partner so the link is always
         # bidirectional, regardless of whether it was set via the
         # action_link_spouse_contact button or the dropdown. The
@@ -1065,11 +1110,15 @@ class ResPartner(models.Model):
         "Lost Years",
         help="Years the member lapsed between drop and reinstatement.",
     )
+    # Age / Member Years are stored so list views can search, group
+    # and sort on them. They roll over on the member's birthday and
+    # initiation anniversary, which cron_refresh_member_stats picks up.
     x_age = fields.Integer(
-        "Age", compute='_compute_age', store=False,
+        "Age", compute='_compute_age', store=True, index=True,
     )
     x_member_years = fields.Integer(
-        "Member Years", compute='_compute_member_years', store=False,
+        "Member Years", compute='_compute_member_years',
+        store=True, index=True,
     )
     x_email_is_undeliverable = fields.Boolean(
         "Email Undeliverable",
@@ -1100,7 +1149,7 @@ class ResPartner(models.Model):
 
     @api.depends('x_date_of_birth')
     def _compute_age(self):
-        today = fields.Date.today()
+        today = fields.Date.context_today(self)
         for rec in self:
             if rec.x_date_of_birth:
                 yrs = today.year - rec.x_date_of_birth.year
@@ -1114,7 +1163,7 @@ class ResPartner(models.Model):
 
     @api.depends('x_date_initiated', 'x_lost_years')
     def _compute_member_years(self):
-        today = fields.Date.today()
+        today = fields.Date.context_today(self)
         for rec in self:
             if rec.x_date_initiated:
                 yrs = today.year - rec.x_date_initiated.year
@@ -1593,7 +1642,7 @@ class ResPartner(models.Model):
         month of April, so they are past due.  The paid-to date must be
         strictly **after** the lodge-year start to count as current."""
         today = fields.Date.context_today(self)
-        cutoff = _current_lodge_year_start(today)
+        cutoff = current_lodge_year_start(today)
         for rec in self:
             d = rec.x_detail_dues_paid_to_date
             rec.x_is_dues_paid = bool(d and d > cutoff)
@@ -1917,7 +1966,7 @@ class ResPartner(models.Model):
     def cron_update_is_dues_paid(self):
         """Runs daily: keeps the stored boolean in sync as the lodge year rolls over."""
         today = fields.Date.context_today(self)
-        cutoff = _current_lodge_year_start(today)
+        cutoff = current_lodge_year_start(today)
         Partner = self.env['res.partner'].sudo()
 
         to_true = Partner.search([
@@ -1940,6 +1989,91 @@ class ResPartner(models.Model):
 
         return len(to_true) + len(to_false)
 
+    # ------------------------------------------------------------------
+    # Time-relative member statistics (Age / Member Years / Honor Years)
+    # ------------------------------------------------------------------
+    #: ir.config_parameter key holding the date of the last stats refresh.
+    MEMBER_STATS_PARAM = 'elkscontacts.member_stats_last_run'
+
+    @api.model
+    def _member_stats_rollover_ids(self, column, last_run, today):
+        """Return ids of partners whose ``column`` month/day anniversary
+        falls in the window (last_run, today].  Handles the year wrap
+        (last run Dec 30, today Jan 2) by OR-ing the two halves."""
+        md = "to_char(%s, 'MMDD')" % column
+        if last_run.year == today.year:
+            where = "%s > %%s AND %s <= %%s" % (md, md)
+        else:
+            where = "(%s > %%s OR %s <= %%s)" % (md, md)
+        self.env.cr.execute(
+            "SELECT id FROM res_partner WHERE %s IS NOT NULL AND %s"
+            % (column, where),
+            (last_run.strftime('%m%d'), today.strftime('%m%d')),
+        )
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.model
+    def cron_refresh_member_stats(self):
+        """Runs nightly: roll the stored Age / Member Years / Years as
+        PER-PEY-POY columns forward.
+
+        Only members whose birthday or initiation anniversary passed
+        since the previous run are recomputed; the honor-year columns
+        are recomputed once, on the first run of a new calendar year.
+        The first run (or one after a gap of a year or more) refreshes
+        everyone."""
+        today = fields.Date.context_today(self)
+        ICP = self.env['ir.config_parameter'].sudo()
+        last_run = fields.Date.to_date(ICP.get_param(self.MEMBER_STATS_PARAM))
+        if last_run and last_run >= today:
+            return 0
+
+        Partner = self.sudo().with_context(active_test=False)
+        honor_fields = [
+            'x_detail_per_start_year', 'x_detail_pey_start_year',
+            'x_detail_poy_start_year',
+        ]
+        full = not last_run or (today - last_run).days >= 365
+        if full:
+            age_ids = Partner.search([('x_date_of_birth', '!=', False)]).ids
+            years_ids = Partner.search([('x_date_initiated', '!=', False)]).ids
+        else:
+            age_ids = self._member_stats_rollover_ids(
+                'x_date_of_birth', last_run, today)
+            years_ids = self._member_stats_rollover_ids(
+                'x_date_initiated', last_run, today)
+        if full or last_run.year != today.year:
+            domain = (['|'] * (len(honor_fields) - 1)) + [
+                (f, '!=', False) for f in honor_fields]
+            honor_ids = Partner.search(domain).ids
+        else:
+            honor_ids = []
+
+        plan = [
+            (['x_age'], age_ids),
+            (['x_member_years'], years_ids),
+            (['x_years_as_per', 'x_years_as_pey', 'x_years_as_poy'],
+             honor_ids),
+        ]
+        touched = set()
+        for fnames, ids in plan:
+            if not ids:
+                continue
+            records = Partner.browse(ids)
+            for fname in fnames:
+                self.env.add_to_compute(self._fields[fname], records)
+            touched.update(ids)
+        Partner.flush_model([f for fnames, _ids in plan for f in fnames])
+
+        ICP.set_param(self.MEMBER_STATS_PARAM, fields.Date.to_string(today))
+        _logger.info(
+            "Member stats refresh: %d age, %d member-years, %d honor-year "
+            "partner(s) recomputed%s.",
+            len(age_ids), len(years_ids), len(honor_ids),
+            ' (full refresh)' if full else '',
+        )
+        return len(touched)
+
     # ══════════════════════════════════════════════════════════════════
     #  CLMS sync — log CLMS-tracked field changes to chatter and
     #  schedule a Secretary to-do to push them into CLMS.
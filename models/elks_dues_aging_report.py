@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Dues delinquency aging report.
+
+Read-only reporting model backed by a PostgreSQL view over res_partner
+(``_auto = False``).  Each row is one active Elks member with the
+number of months their dues are behind and the aging bucket that puts
+them in (current, 1–3, 4–6, 7–12, 12+ months).  Because it is a plain
+view, every open of the report is current — no refresh step — and the
+grouping (lodge number, dues rate code, pay cycle, bucket) runs as a
+single GROUP BY in the database instead of loading every member.
+"""
+from odoo import fields, models, tools
+
+AGING_BUCKETS = [
+    ('current', 'Current'),
+    ('1_3', '1–3 Months'),
+    ('4_6', '4–6 Months'),
+    ('7_12', '7–12 Months'),
+    ('12_plus', '12+ Months'),
+]
+
+
+class ElksDuesAgingReport(models.Model):
+    _name = "elks.dues.aging.report"
+    _description = "Dues Delinquency Aging"
+    _auto = False
+    _order = "delinquent_months desc, partner_id"
+
+    partner_id = fields.Many2one('res.partner', string="Member", readonly=True)
+    member_num = fields.Char("Member #", readonly=True)
+    lodge_num = fields.Char("Lodge #", readonly=True)
+    dues_rate_code = fields.Char("Dues Rate Code", readonly=True)
+    pay_cycle = fields.Selection(
+        [('april', 'April Pay'), ('october', 'October Pay')],
+        string="Dues Pay Cycle", readonly=True,
+    )
+    dues_paid_to_date = fields.Date("Dues Paid To", readonly=True)
+    delinquent_months = fields.Integer(
+        "Months Delinquent", readonly=True, aggregator='max',
+        help="The larger of CLMS DetailDelinquentMonths and the whole or "
+             "partial months elapsed since the paid-to date.",
+    )
+    aging_bucket = fields.Selection(
+        AGING_BUCKETS, string="Aging", readonly=True,
+    )
+
+    def _months_sql(self):
+        """SQL for the effective months delinquent of a partner row."""
+        return """
+            GREATEST(
+                COALESCE(p.x_detail_delinquent_months, 0),
+                CASE
+                    WHEN p.x_detail_dues_paid_to_date IS NULL
+                      OR p.x_detail_dues_paid_to_date >= CURRENT_DATE
+                    THEN 0
+                    ELSE (
+                        date_part('year', age(CURRENT_DATE, p.x_detail_dues_paid_to_date)) * 12
+                        + date_part('month', age(CURRENT_DATE, p.x_detail_dues_paid_to_date))
+                        + CASE WHEN date_part('day', age(CURRENT_DATE, p.x_detail_dues_paid_to_date)) > 0
+                               THEN 1 ELSE 0 END
+                    )::int
+                END
+            )
+        """
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        months = self._months_sql()
+        self.env.cr.execute(f"""
+            CREATE OR REPLACE VIEW {self._table} AS (
+                SELECT
+                    p.id AS id,
+                    p.id AS partner_id,
+                    p.x_detail_member_num AS member_num,
+                    p.x_detail_lodge_num AS lodge_num,
+                    p.x_dues_rate_code AS dues_rate_code,
+                    p.x_dues_pay_cycle AS pay_cycle,
+                    p.x_detail_dues_paid_to_date AS dues_paid_to_date,
+                    m.months AS delinquent_months,
+                    CASE
+                        WHEN m.months <= 0 THEN 'current'
+                        WHEN m.months <= 3 THEN '1_3'
+                        WHEN m.months <= 6 THEN '4_6'
+                        WHEN m.months <= 12 THEN '7_12'
+                        ELSE '12_plus'
+                    END AS aging_bucket
+                FROM res_partner p
+                CROSS JOIN LATERAL (SELECT {months} AS months) m
+                WHERE p.active
+                  AND p.x_is_member
+            )
+        """)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Lodge-year helpers shared by every model, wizard and controller.
+
+The Elks lodge year runs April 1 – March 31 and is labelled by its two
+calendar years, e.g. ``'2025-2026'``.  Everything that needs to turn a
+date into a lodge year, list the selectable lodge years, or compute the
+same thing in SQL goes through this module so the rule lives in exactly
+one place.
+
+Plain functions, no Odoo models.  Callables that Odoo uses as field
+``default=`` / ``selection=`` accept an optional ``self`` (Odoo passes
+the recordset as the first argument), like ``_next_lodge_year_end`` in
+``elks_volunteer_training``.
+"""
+from datetime import date
+from functools import lru_cache
+
+#: Month the lodge year starts in (April).
+LODGE_YEAR_START_MONTH = 4
+
+#: Selection window around the current lodge year.
+SELECTION_YEARS_BACK = 10
+SELECTION_YEARS_FORWARD = 5
+
+
+def lodge_year_start_year(d):
+    """Return the calendar year the lodge year containing ``d`` began."""
+    return d.year if d.month >= LODGE_YEAR_START_MONTH else d.year - 1
+
+
+def current_lodge_year_start(today=None):
+    """Return April 1 of the current lodge year.
+
+    If today is Jan–Mar, we're still in the lodge year that started
+    April 1 of last calendar year.
+    """
+    today = today or date.today()
+    return date(lodge_year_start_year(today), LODGE_YEAR_START_MONTH, 1)
+
+
+@lru_cache(maxsize=256)
+def _label_for_start(start):
+    return f"{start}-{start + 1}"
+
+
+def lodge_year_label(d):
+    """Return the lodge year label for a date (``'2025-2026'``), or
+    False when ``d`` is empty."""
+    if not d:
+        return False
+    return _label_for_start(lodge_year_start_year(d))
+
+
+def current_lodge_year(today=None):
+    """Return the current lodge year label, e.g. ``'2025-2026'``."""
+    return lodge_year_label(today or date.today())
+
+
+def lodge_year_end(d):
+    """Return March 31 closing the lodge year that contains ``d``."""
+    return date(lodge_year_start_year(d) + 1, LODGE_YEAR_START_MONTH - 1, 31)
+
+
+def lodge_year_bounds(label):
+    """Return ``(April 1, March 31)`` for a lodge year label, or
+    ``(None, None)`` when the label can't be parsed."""
+    try:
+        start = int((label or '').split('-')[0])
+    except ValueError:
+        return None, None
+    return (date(start, LODGE_YEAR_START_MONTH, 1),
+            date(start + 1, LODGE_YEAR_START_MONTH - 1, 31))
+
+
+def next_lodge_year_label(label, years=1):
+    """Return the label ``years`` lodge years after ``label``."""
+    start, _end = lodge_year_bounds(label)
+    if start is None:
+        return False
+    return _label_for_start(start.year + years)
+
+
+@lru_cache(maxsize=16)
+def _selection_for_start(current_start, back, forward):
+    return tuple(
+        (_label_for_start(y), _label_for_start(y))
+        for y in range(current_start - back, current_start + forward + 1)
+    )
+
+
+def lodge_year_selection_range(back, forward):
+    """Selection list of lodge years from ``back`` years before to
+    ``forward`` years after the current one.
+
+    Memoized per (current lodge year, window), so each list is built
+    once per year instead of on every ``fields_get`` / widget render.
+    """
+    return list(_selection_for_start(
+        lodge_year_start_year(date.today()), back, forward))
+
+
+def lodge_year_selections(self=None):
+    """Selection list of lodge years (10 back, 5 forward)."""
+    return lodge_year_selection_range(
+        SELECTION_YEARS_BACK, SELECTION_YEARS_FORWARD)
+
+
+def default_lodge_year(self=None):
+    """Field default: the current lodge year label."""
+    return current_lodge_year()
+
+
+def compute_lodge_years(records, date_field, target_field='lodge_year'):
+    """Set ``target_field`` from ``date_field`` on a whole recordset.
+
+    Labels are memoized per (start year), so a recordset of thousands
+    of rows costs one string build per distinct lodge year.
+    """
+    for rec in records:
+        rec[target_field] = lodge_year_label(rec[date_field])
+
+
+def lodge_year_start_sql(expr):
+    """SQL expression computing the calendar year the lodge year began
+    from a date expression (e.g. ``'h.event_date'``) — the SQL twin of
+    ``lodge_year_start_year``."""
+    return (
+        "(date_part('year', {c})::int"
+        " - CASE WHEN date_part('month', {c}) >= {m} THEN 0 ELSE 1 END)"
+    ).format(c=expr, m=LODGE_YEAR_START_MONTH)
+
+
+def lodge_year_sql(column):
+    """SQL expression computing the lodge year label from a date
+    column — the SQL twin of ``lodge_year_label``."""
+    column = '"%s"' % column
+    start = lodge_year_start_sql(column)
+    return (
+        "CASE WHEN {c} IS NULL THEN NULL"
+        " ELSE {s}::text || '-' || ({s} + 1)::text END"
+    ).format(c=column, s=start)
+
+
+def lodge_year_bounds_sql(label):
+    """SQL expressions ``(start, end)`` for the first and last day of
+    the lodge year named by the label expression ``label`` (e.g.
+    ``'t.lodge_year'``) — the SQL twin of ``lodge_year_bounds``.  Both
+    are NULL when the label doesn't start with a year."""
+    year = "(CASE WHEN {l} ~ '^[0-9]{{4}}' THEN left({l}, 4)::int END)".format(
+        l=label)
+    return (
+        "make_date({y}, {m}, 1)".format(y=year, m=LODGE_YEAR_START_MONTH),
+        "(make_date({y} + 1, {m}, 1) - 1)".format(
+            y=year, m=LODGE_YEAR_START_MONTH),
+    )
+
+
+def backfill_lodge_year(cr, table, date_column, target_column='lodge_year'):
+    """Recompute a stored lodge-year column in one UPDATE instead of an
+    ORM recompute.  Only rows whose value is wrong are touched; returns
+    the number of rows updated."""
+    expr = lodge_year_sql(date_column)
+    cr.execute(f"""
+        UPDATE {table}
+           SET {target_column} = {expr}
+         WHERE {target_column} IS DISTINCT FROM {expr}
+    """)
+    return cr.rowcount
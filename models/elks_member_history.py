@@ -8,8 +8,12 @@ Paid-to date changes, transfers, reinstatements, suspensions, drops, etc.
 Records can be auto-created by the membership application workflow or
 imported from CLMS, and can also be manually edited by the Secretary.
 """
+import re
+
 from odoo import api, fields, models, _
 
+from .elks_lodge_year import lodge_year_start_year
+
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -35,6 +39,14 @@ HISTORY_TYPES = [
     ('other', 'Other'),
 ]
 
+# Event types that count as a membership gain / loss when the CLMS
+# ``chg`` column is blank (e.g. rows logged by the drop wizard).
+GAIN_TYPES = ('initiated', 'reinstatement', 'affiliation')
+LOSS_TYPES = ('dropped', 'deceased', 'absolute_dimit')
+
+#: Fields whose change moves a history row between snapshot buckets.
+SNAPSHOT_FIELDS = ('chg', 'chg_year', 'event_type', 'event_date')
+
 
 class ElksMemberHistory(models.Model):
     _name = "elks.member.history"
@@ -105,3 +117,87 @@ class ElksMemberHistory(models.Model):
         ondelete='set null',
         help="Link to the membership application that generated this entry.",
     )
+
+    # ------------------------------------------------------------------
+    # Membership snapshot maintenance
+    # ------------------------------------------------------------------
+    def _snapshot_change(self):
+        """Return ``(year_start, event_type, delta)`` for this row's
+        effect on lodge membership totals, or None when it has none.
+
+        ``chg`` wins when it holds a signed integer; otherwise gain /
+        loss event types count as +1 / -1.  The lodge year comes from
+        the first four digits of ``chg_year``, falling back to the
+        event date.  Keep in sync with ``_snapshot_change_sql``.
+        """
+        self.ensure_one()
+        raw = (self.chg or '').strip()
+        if re.fullmatch(r'[+-]?[0-9]+', raw):
+            delta = int(raw)
+        elif self.event_type in GAIN_TYPES:
+            delta = 1
+        elif self.event_type in LOSS_TYPES:
+            delta = -1
+        else:
+            return None
+        if not delta:
+            return None
+        m = re.match(r'[0-9]{4}', (self.chg_year or '').strip())
+        if m:
+            year = int(m.group())
+        elif self.event_date:
+            year = lodge_year_start_year(self.event_date)
+        else:
+            return None
+        return year, self.event_type, delta
+
+    def _snapshot_deltas(self, sign=1):
+        """Sum the snapshot contributions of this recordset into
+        ``{(year_start, event_type): [gains, losses]}``.  ``sign=-1``
+        gives the amounts to subtract when a row is changed or
+        removed."""
+        deltas = {}
+        for rec in self:
+            change = rec._snapshot_change()
+            if not change:
+                continue
+            year, event_type, delta = change
+            bucket = deltas.setdefault((year, event_type), [0, 0])
+            if delta > 0:
+                bucket[0] += sign * delta
+            else:
+                bucket[1] += sign * -delta
+        return deltas
+
+    @api.model
+    def _merge_deltas(self, *all_deltas):
+        merged = {}
+        for deltas in all_deltas:
+            for key, (gains, losses) in deltas.items():
+                bucket = merged.setdefault(key, [0, 0])
+                bucket[0] += gains
+                bucket[1] += losses
+        return merged
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['elks.membership.snapshot']._apply_deltas(
+            records._snapshot_deltas())
+        return records
+
+    def write(self, vals):
+        if not any(f in vals for f in SNAPSHOT_FIELDS):
+            return super().write(vals)
+        before = self._snapshot_deltas(sign=-1)
+        res = super().write(vals)
+        self.env['elks.membership.snapshot']._apply_deltas(
+            self._merge_deltas(before, self._snapshot_deltas()))
+        return res
+
+    def unlink(self):
+        before = self._snapshot_deltas(sign=-1)
+        res = super().unlink()
+        self.env['elks.membership.snapshot']._apply_deltas(before)
+        return res
+
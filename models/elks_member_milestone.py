@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Member milestone calendar.
+
+A small materialized calendar of the dates the lodge marks every year:
+member birthdays, initiation anniversaries (25 / 50-year pins), wedding
+anniversaries and spouse birthdays.  There is one row per partner per
+milestone kind, keyed by an indexed ``month_day`` integer (MMDD, e.g.
+``415`` for April 15), so "who has a milestone in the next 30 days" is
+a single range query instead of a scan of every partner.
+
+Rows are kept in step by ``res.partner`` create/write (see
+``ResPartner._sync_member_milestones``) and can be rebuilt wholesale in
+SQL with ``_rebuild_calendar`` (install hook / upgrade migration).
+"""
+import calendar
+from datetime import date, timedelta
+
+from odoo import api, fields, models, _
+
+MILESTONE_KINDS = [
+    ('birthday', 'Birthday'),
+    ('initiation', 'Initiation Anniversary'),
+    ('anniversary', 'Wedding Anniversary'),
+    ('spouse_birthday', 'Spouse Birthday'),
+]
+
+#: Milestone kind -> res.partner date field it is derived from.
+MILESTONE_SOURCE_FIELDS = {
+    'birthday': 'x_date_of_birth',
+    'initiation': 'x_date_initiated',
+    'anniversary': 'x_anniversary_date',
+    'spouse_birthday': 'x_spouse_birthday',
+}
+
+#: Member-year counts that earn a service pin.
+PIN_YEARS = (25, 50)
+
+
+def _month_day(d):
+    """Return the MMDD integer for a date (April 15 -> 415)."""
+    return d.month * 100 + d.day
+
+
+def _occurrence(source, year):
+    """Return the anniversary of ``source`` in ``year``.  Feb 29 dates
+    fall on March 1 in common years — the same day x_age rolls over."""
+    if source.month == 2 and source.day == 29 and not calendar.isleap(year):
+        return date(year, 3, 1)
+    return source.replace(year=year)
+
+
+class ElksMemberMilestone(models.Model):
+    _name = "elks.member.milestone"
+    _description = "Member Milestone Calendar"
+    _order = "month_day, kind, partner_id"
+
+    partner_id = fields.Many2one(
+        'res.partner', string="Member", required=True,
+        ondelete='cascade', index=True,
+    )
+    kind = fields.Selection(
+        MILESTONE_KINDS, string="Milestone", required=True, index=True,
+    )
+    source_date = fields.Date(
+        "Original Date", required=True,
+        help="Birth date, initiation date or wedding date the milestone "
+             "repeats from.",
+    )
+    month_day = fields.Integer(
+        "Month/Day", required=True, index=True,
+        help="MMDD key of the source date (e.g. 415 = April 15). "
+             "Indexed so date-window lookups are a single range scan.",
+    )
+    next_date = fields.Date(
+        "Next Occurrence", compute='_compute_next',
+    )
+    next_years = fields.Integer(
+        "Years", compute='_compute_next',
+        help="Age, member years or years married on the next occurrence.",
+    )
+    is_pin_milestone = fields.Boolean(
+        "Service Pin", compute='_compute_next',
+        help="Initiation anniversary that reaches a 25 / 50-year pin.",
+    )
+
+    def _compute_next(self):
+        today = fields.Date.context_today(self)
+        for rec in self:
+            info = rec._occurrence_info(today)
+            rec.next_date = info['date']
+            rec.next_years = info['years']
+            rec.is_pin_milestone = info['is_pin']
+
+    def _occurrence_info(self, date_from):
+        """Return the first occurrence of this milestone on or after
+        ``date_from`` with its year count and pin flag."""
+        self.ensure_one()
+        occ = _occurrence(self.source_date, date_from.year)
+        if occ < date_from:
+            occ = _occurrence(self.source_date, date_from.year + 1)
+        years = occ.year - self.source_date.year
+        if self.kind == 'initiation':
+            years -= self.partner_id.x_lost_years or 0
+        years = max(0, years)
+        return {
+            'date': occ,
+            'years': years,
+            'is_pin': self.kind == 'initiation' and years in PIN_YEARS,
+        }
+
+    # ------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------
+    @api.model
+    def _month_day_domain(self, date_from, date_to):
+        """Domain on ``month_day`` matching every anniversary that falls
+        in [date_from, date_to].  A window crossing December 31 becomes
+        ``month_day >= lo OR month_day <= hi``; a window of a year or
+        more matches everything."""
+        if (date_to - date_from).days >= 365:
+            return []
+        lo, hi = _month_day(date_from), _month_day(date_to)
+        # Feb 29 anniversaries land on March 1 in common years, so a
+        # window starting exactly on March 1 must also pick up 229.
+        if lo == 301 and not calendar.isleap(date_from.year):
+            lo = 229
+        if lo <= hi:
+            return [('month_day', '>=', lo), ('month_day', '<=', hi)]
+        return ['|', ('month_day', '>=', lo), ('month_day', '<=', hi)]
+
+    @api.model
+    def get_upcoming_milestones(self, date_from=None, days=30, kinds=None,
+                                members_only=True):
+        """Return the milestones falling in the next ``days`` days.
+
+        One indexed range query on ``month_day`` selects the rows; the
+        result is a list of dicts sorted by occurrence date::
+
+            {'partner_id', 'partner_name', 'kind', 'kind_label',
+             'source_date', 'date', 'years', 'is_pin'}
+        """
+        date_from = fields.Date.to_date(date_from) or \
+            fields.Date.context_today(self)
+        date_to = date_from + timedelta(days=max(0, days))
+        domain = self._month_day_domain(date_from, date_to)
+        if kinds:
+            domain = domain + [('kind', 'in', list(kinds))]
+        if members_only:
+            domain = domain + [('partner_id.x_is_member', '=', True)]
+
+        labels = dict(MILESTONE_KINDS)
+        result = []
+        for rec in self.search(domain):
+            info = rec._occurrence_info(date_from)
+            if info['date'] > date_to:
+                continue
+            result.append({
+                'partner_id': rec.partner_id.id,
+                'partner_name': rec.partner_id.name or '',
+                'kind': rec.kind,
+                'kind_label': labels.get(rec.kind, rec.kind),
+                'source_date': rec.source_date,
+                'date': info['date'],
+                'years': info['years'],
+                'is_pin': info['is_pin'],
+            })
+        result.sort(key=lambda r: (r['date'], r['kind'], r['partner_name']))
+        return result
+
+    @api.model
+    def action_open_upcoming(self, days=30):
+        """Open the milestone list filtered to the next ``days`` days."""
+        today = fields.Date.context_today(self)
+        domain = self._month_day_domain(today, today + timedelta(days=days))
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Upcoming Milestones (next %s days)') % days,
+            'res_model': self._name,
+            'view_mode': 'list,form',
+            'domain': domain + [('partner_id.x_is_member', '=', True)],
+            'context': {'search_default_group_kind': 1},
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    @api.model
+    def _sync_partners(self, partners):
+        """Replace the calendar rows of ``partners`` with rows built from
+        their current milestone dates."""
+        if not partners:
+            return
+        Milestone = self.sudo()
+        Milestone.search([('partner_id', 'in', partners.ids)]).unlink()
+        vals_list = []
+        for partner in partners:
+            for kind, fname in MILESTONE_SOURCE_FIELDS.items():
+                d = partner[fname]
+                if d:
+                    vals_list.append({
+                        'partner_id': partner.id,
+                        'kind': kind,
+                        'source_date': d,
+                        'month_day': _month_day(d),
+                    })
+        if vals_list:
+            Milestone.create(vals_list)
+
+    @api.model
+    def _rebuild_calendar(self):
+        """Rebuild the whole calendar from res_partner in SQL.  Used on
+        install and by the upgrade migration; returns the row count."""
+        self.env['res.partner'].flush_model(
+            list(MILESTONE_SOURCE_FIELDS.values()))
+        self.flush_model()
+        cr = self.env.cr
+        cr.execute("DELETE FROM elks_member_milestone")
+        total = 0
+        for kind, column in MILESTONE_SOURCE_FIELDS.items():
+            cr.execute(f"""
+                INSERT INTO elks_member_milestone
+                       (partner_id, kind, source_date, month_day,
+                        create_uid, create_date, write_uid, write_date)
+                SELECT id, %s, {column},
+                       (date_part('month', {column}) * 100
+                        + date_part('day', {column}))::int,
+                       %s, now() at time zone 'UTC',
+                       %s, now() at time zone 'UTC'
+                  FROM res_partner
+                 WHERE {column} IS NOT NULL
+            """, (kind, self.env.uid, self.env.uid))
+            total += cr.rowcount
+        self.invalidate_model()
+        return total
@@ -16,7 +16,14 @@ from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
 from dateutil.relativedelta import relativedelta
 
-import datetime
+from .elks_lodge_year import (
+    compute_lodge_years,
+    current_lodge_year,
+    lodge_year_end,
+    lodge_year_selection_range,
+    lodge_year_start_year,
+)
+
 import logging
 import re
 
@@ -47,13 +54,7 @@ def _format_us_phone(raw):
 def _reinstatement_year_selections(self):
     """Generate selection list of lodge years for reinstatement.
     Goes back 100 years and forward 10 years to cover long-lapsed members."""
-    today = datetime.date.today()
-    current_start = today.year if today.month >= 4 else today.year - 1
-    years = []
-    for y in range(current_start - 100, current_start + 11):
-        label = f"{y}-{y + 1}"
-        years.append((label, label))
-    return years
+    return lodge_year_selection_range(100, 10)
 
 
 APPLICATION_STAGES = [
@@ -728,16 +729,7 @@ class ElksMembershipApplication(models.Model):
 
     @api.depends('date_proposed')
     def _compute_lodge_year(self):
-        for rec in self:
-            if rec.date_proposed:
-                d = rec.date_proposed
-                # Lodge year runs Apr 1 – Mar 31
-                if d.month >= 4:
-                    rec.lodge_year = f"{d.year}-{d.year + 1}"
-                else:
-                    rec.lodge_year = f"{d.year - 1}-{d.year}"
-            else:
-                rec.lodge_year = False
+        compute_lodge_years(self, 'date_proposed')
 
     # ------------------------------------------------------------------
     # Dropped contact lookup (reinstatements)
@@ -984,10 +976,7 @@ class ElksMembershipApplication(models.Model):
                 vals['chg'] = '+1'
                 # Lodge year for the change
                 d = event_date or fields.Date.context_today(self)
-                if d.month >= 4:
-                    vals['chg_year'] = str(d.year)
-                else:
-                    vals['chg_year'] = str(d.year - 1)
+                vals['chg_year'] = str(lodge_year_start_year(d))
             elif event_type == 'orientation':
                 pass
             elif event_type == 'paid_to':
@@ -1202,16 +1191,9 @@ class ElksMembershipApplication(models.Model):
         """Return the display name of the partner currently holding
         the given officer position for the current lodge year, or ''
         if nobody is assigned."""
-        today = fields.Date.context_today(self)
-        if today.month >= 4:
-            year_str = f"{today.year}-{today.year + 1}"
-        else:
-            year_str = f"{today.year - 1}-{today.year}"
-        term = self.env['elks.officer.term'].search([
-            ('position', '=', position_key),
-            ('lodge_year', '=', year_str),
-            ('active', '=', True),
-        ], limit=1)
+        year_str = current_lodge_year(fields.Date.context_today(self))
+        term = self.env['elks.officer.term'].get_position_holders(
+            position_key, year_str, limit=1)
         return term.partner_id.name if term and term.partner_id else ''
 
     def _build_initiation_clms_defaults(self):
@@ -1361,10 +1343,7 @@ class ElksMembershipApplication(models.Model):
                 new_paid_to = current_paid_to + relativedelta(years=1)
             else:
                 # New member — set to end of current lodge year (Mar 31)
-                if initiation_date.month >= 4:
-                    new_paid_to = initiation_date.replace(year=initiation_date.year + 1, month=3, day=31)
-                else:
-                    new_paid_to = initiation_date.replace(month=3, day=31)
+                new_paid_to = lodge_year_end(initiation_date)
             partner.write({'x_detail_dues_paid_to_date': new_paid_to})
 
             vals = {
@@ -1502,12 +1481,7 @@ class ElksMembershipApplication(models.Model):
             if current_paid_to and current_paid_to > reinstatement_date:
                 new_paid_to = current_paid_to + relativedelta(years=1)
             else:
-                if reinstatement_date.month >= 4:
-                    new_paid_to = reinstatement_date.replace(
-                        year=reinstatement_date.year + 1, month=3, day=31,
-                    )
-                else:
-                    new_paid_to = reinstatement_date.replace(month=3, day=31)
+                new_paid_to = lodge_year_end(reinstatement_date)
             partner.write({'x_detail_dues_paid_to_date': new_paid_to})
 
             # Mark application as initiated (same final stage)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Membership count snapshots per lodge year.
+
+Pre-aggregated gains and losses for the Grand Lodge annual report, one
+row per (lodge year, history event type).  Rows are maintained
+incrementally by ``elks.member.history`` create / write / unlink — each
+change adds or subtracts its own contribution with a single UPSERT — and
+can be rebuilt from scratch in SQL with ``_rebuild_snapshots`` (install
+hook / upgrade migration, or the "Rebuild Membership Snapshots" menu).
+
+The "Membership by Lodge Year" pivot and graph read these rows, so
+year-over-year reporting never re-aggregates the history table.
+"""
+from odoo import api, fields, models, _
+
+from .elks_lodge_year import lodge_year_start_sql
+from .elks_member_history import GAIN_TYPES, HISTORY_TYPES, LOSS_TYPES
+
+
+class ElksMembershipSnapshot(models.Model):
+    _name = "elks.membership.snapshot"
+    _description = "Membership Snapshot (per Lodge Year)"
+    _order = "year_start desc, event_type"
+
+    year_start = fields.Integer(
+        "Lodge Year Start", required=True, index=True,
+        help="Calendar year the lodge year began (April 1).",
+    )
+    lodge_year = fields.Char("Lodge Year", required=True)
+    event_type = fields.Selection(
+        HISTORY_TYPES, string="Change Type", required=True,
+    )
+    gains = fields.Integer("Gains")
+    losses = fields.Integer("Losses")
+    net = fields.Integer("Net Change")
+
+    _year_type_uniq = models.Constraint(
+        'UNIQUE(year_start, event_type)',
+        'Only one snapshot row per lodge year and change type.',
+    )
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    @api.model
+    def _apply_deltas(self, deltas):
+        """Add ``{(year_start, event_type): [gains, losses]}`` to the
+        snapshot rows, creating missing rows, in one UPSERT."""
+        rows = [
+            (year, f"{year}-{year + 1}", event_type,
+             gains, losses, gains - losses)
+            for (year, event_type), (gains, losses) in deltas.items()
+            if gains or losses
+        ]
+        if not rows:
+            return
+        uid = self.env.uid
+        placeholders = ", ".join(
+            ["(%s, %s, %s, %s, %s, %s, %s, now() at time zone 'UTC', "
+             "%s, now() at time zone 'UTC')"] * len(rows))
+        params = [v for row in rows for v in row + (uid, uid)]
+        self.flush_model()
+        self.env.cr.execute(f"""
+            INSERT INTO elks_membership_snapshot
+                   (year_start, lodge_year, event_type, gains, losses, net,
+                    create_uid, create_date, write_uid, write_date)
+            VALUES {placeholders}
+            ON CONFLICT (year_start, event_type) DO UPDATE
+               SET gains = elks_membership_snapshot.gains + EXCLUDED.gains,
+                   losses = elks_membership_snapshot.losses + EXCLUDED.losses,
+                   net = elks_membership_snapshot.net + EXCLUDED.net,
+                   write_uid = EXCLUDED.write_uid,
+                   write_date = EXCLUDED.write_date
+        """, params)
+        self.invalidate_model()
+
+    @api.model
+    def _snapshot_change_sql(self):
+        """Return (year_sql, delta_sql) over ``elks_member_history h`` —
+        the SQL twin of ``ElksMemberHistory._snapshot_change``."""
+        delta = """
+            CASE
+                WHEN btrim(h.chg) ~ '^[+-]?[0-9]+$' THEN btrim(h.chg)::int
+                WHEN h.event_type IN %(gains)s THEN 1
+                WHEN h.event_type IN %(losses)s THEN -1
+                ELSE 0
+            END
+        """
+        year = """
+            COALESCE(
+                substring(btrim(h.chg_year) from '^[0-9]{4}')::int,
+                %s
+            )
+        """ % lodge_year_start_sql('h.event_date')
+        return year, delta
+
+    @api.model
+    def _rebuild_snapshots(self):
+        """Rebuild every snapshot row from the history table in one
+        grouped INSERT.  Returns the number of rows written."""
+        self.env['elks.member.history'].flush_model()
+        self.flush_model()
+        year, delta = self._snapshot_change_sql()
+        cr = self.env.cr
+        cr.execute("DELETE FROM elks_membership_snapshot")
+        cr.execute(f"""
+            INSERT INTO elks_membership_snapshot
+                   (year_start, lodge_year, event_type, gains, losses, net,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT c.year_start,
+                   c.year_start::text || '-' || (c.year_start + 1)::text,
+                   c.event_type,
+                   SUM(GREATEST(c.delta, 0)),
+                   SUM(GREATEST(-c.delta, 0)),
+                   SUM(c.delta),
+                   %(uid)s, now() at time zone 'UTC',
+                   %(uid)s, now() at time zone 'UTC'
+              FROM (
+                    SELECT {year} AS year_start,
+                           h.event_type,
+                           {delta} AS delta
+                      FROM elks_member_history h
+                   ) c
+             WHERE c.year_start IS NOT NULL
+               AND c.delta <> 0
+             GROUP BY c.year_start, c.event_type
+        """, {
+            'gains': GAIN_TYPES,
+            'losses': LOSS_TYPES,
+            'uid': self.env.uid,
+        })
+        count = cr.rowcount
+        self.invalidate_model()
+        return count
+
+    @api.model
+    def action_rebuild_snapshots(self):
+        """Menu action: rebuild all snapshot rows from history."""
+        count = self._rebuild_snapshots()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Membership Snapshots'),
+                'message': _('Rebuilt %s snapshot row(s) from member '
+                             'history.') % count,
+                'type': 'success',
+                'sticky': False,
+            },
+        }
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Background Officer Photo Poster generation.
+
+A 300 DPI poster takes longer to render than a web request is allowed
+to run, so the poster wizard can queue an ``elks.officer.poster.job``
+instead.  The "Officer Poster Jobs" cron picks queued jobs up one at a
+time (it is triggered as soon as a job is queued), renders them with
+the wizard's own ``_render_poster``, stores the PDF and preview as
+``ir.attachment`` records in the filestore and notifies the requester
+in Discuss.
+
+Each attempt is committed before rendering starts, so a worker killed
+mid-render (memory / time limit) can't leave the job retrying forever:
+after MAX_ATTEMPTS it is marked failed.
+"""
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+
+from .elks_officer_term import _default_lodge_year, _lodge_year_selections
+
+_logger = logging.getLogger(__name__)
+
+#: Renders started per job before it is given up on.
+MAX_ATTEMPTS = 2
+#: Finished and failed jobs (and their files) are kept this long.
+JOB_RETENTION_DAYS = 30
+
+#: Poster PDF engines (officer_poster_vector / officer_poster_builder).
+OUTPUT_ENGINES = [
+    ('vector', 'Vector PDF (sharp text)'),
+    ('raster', 'Single Image'),
+]
+
+
+class ElksOfficerPosterJob(models.Model):
+    _name = "elks.officer.poster.job"
+    _description = "Officer Photo Poster Job"
+    _inherit = ["mail.thread"]
+    _order = "id desc"
+
+    name = fields.Char("Poster", compute="_compute_name", store=True)
+    user_id = fields.Many2one(
+        "res.users", string="Requested By", required=True, readonly=True,
+        default=lambda self: self.env.user,
+    )
+    lodge_year = fields.Selection(
+        selection=_lodge_year_selections,
+        string="Lodge Year", required=True,
+        default=_default_lodge_year,
+    )
+    width_in = fields.Float("Width (inches)", default=47.0, required=True)
+    height_in = fields.Float("Height (inches)", default=29.0, required=True)
+    dpi = fields.Integer("Resolution (DPI)", default=150, required=True)
+    include_inactive = fields.Boolean("Include Archived Terms")
+    output_engine = fields.Selection(
+        OUTPUT_ENGINES, string="PDF Output", default='vector', required=True,
+    )
+
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('done', 'Ready'),
+        ('failed', 'Failed'),
+    ], default='queued', required=True, readonly=True, tracking=True)
+    attempts = fields.Integer(readonly=True)
+    date_done = fields.Datetime("Finished", readonly=True)
+    error_message = fields.Text("Error", readonly=True)
+
+    # Results — attachments live in the filestore, not in a column.
+    pdf_attachment_id = fields.Many2one(
+        "ir.attachment", string="Poster PDF", readonly=True,
+        ondelete="set null",
+    )
+    preview_attachment_id = fields.Many2one(
+        "ir.attachment", string="Preview File", readonly=True,
+        ondelete="set null",
+    )
+    poster_preview = fields.Binary(
+        "Preview", related="preview_attachment_id.datas",
+    )
+    officer_count = fields.Integer("Officers Found", readonly=True)
+    staples_instructions = fields.Text("Print Shop Instructions",
+                                       readonly=True)
+
+    @api.depends('lodge_year', 'dpi')
+    def _compute_name(self):
+        for job in self:
+            job.name = _("Officer Board %(yr)s (%(dpi)s DPI)") % {
+                'yr': job.lodge_year or '',
+                'dpi': job.dpi,
+            }
+
+    def _trigger_worker(self):
+        cron = self.env.ref(
+            'elkscontacts.ir_cron_officer_poster_jobs', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    @api.model
+    def cron_process_poster_jobs(self):
+        """Render the oldest queued job, then re-trigger for the next
+        one so each poster is rendered and committed in its own run."""
+        self._cleanup_old_jobs()
+        jobs = self.search([('state', '=', 'queued')], order='id', limit=2)
+        if not jobs:
+            return
+        jobs[0]._run()
+        if len(jobs) > 1:
+            self._trigger_worker()
+
+    def _run(self):
+        self.ensure_one()
+        if self.attempts >= MAX_ATTEMPTS:
+            self._finish_failed(_(
+                "Rendering was interrupted %s times (the server most "
+                "likely ran out of memory or time). Try a lower DPI."
+            ) % MAX_ATTEMPTS)
+            return
+        # Commit the attempt before rendering so it survives a worker
+        # that is killed mid-render.
+        self.attempts += 1
+        self.env.cr.commit()
+
+        Wizard = self.env['elks.officer.poster.wizard'].with_user(
+            self.user_id)
+        try:
+            with self.env.cr.savepoint():
+                result = Wizard.create({
+                    'lodge_year': self.lodge_year,
+                    'width_in': self.width_in,
+                    'height_in': self.height_in,
+                    'dpi': self.dpi,
+                    'include_inactive': self.include_inactive,
+                    'output_engine': self.output_engine,
+                })._render_poster()
+        except UserError as e:
+            self._finish_failed(str(e))
+            return
+        except Exception as e:
+            _logger.exception("Officer poster job %s failed.", self.id)
+            self._finish_failed(str(e) or e.__class__.__name__)
+            return
+
+        Attachment = self.env['ir.attachment'].sudo()
+        old = self.pdf_attachment_id | self.preview_attachment_id
+        pdf = Attachment.create({
+            'name': result['filename'],
+            'raw': result['pdf'],
+            'mimetype': 'application/pdf',
+            'res_model': self._name,
+            'res_id': self.id,
+        })
+        preview = Attachment.create({
+            'name': result['filename'].replace('.pdf', '_preview.png'),
+            'raw': result['preview'],
+            'mimetype': 'image/png',
+            'res_model': self._name,
+            'res_id': self.id,
+        })
+        self.write({
+            'state': 'done',
+            'date_done': fields.Datetime.now(),
+            'error_message': False,
+            'pdf_attachment_id': pdf.id,
+            'preview_attachment_id': preview.id,
+            'officer_count': result['officer_count'],
+            'staples_instructions': result['staples_instructions'],
+        })
+        old.unlink()
+        self._notify_requester(_(
+            "Your officer poster for %(yr)s is ready (%(n)s officers)."
+        ) % {'yr': self.lodge_year, 'n': result['officer_count']})
+
+    def _finish_failed(self, message):
+        self.write({
+            'state': 'failed',
+            'date_done': fields.Datetime.now(),
+            'error_message': message,
+        })
+        self._notify_requester(_(
+            "Your officer poster for %(yr)s could not be generated: %(err)s"
+        ) % {'yr': self.lodge_year, 'err': message})
+
+    def _notify_requester(self, body):
+        self.message_notify(
+            partner_ids=self.user_id.partner_id.ids,
+            subject=self.name,
+            body=body,
+        )
+
+    @api.model
+    def _cleanup_old_jobs(self):
+        cutoff = fields.Datetime.now() - timedelta(days=JOB_RETENTION_DAYS)
+        old = self.search([
+            ('state', 'in', ('done', 'failed')),
+            ('date_done', '<', cutoff),
+        ])
+        if old:
+            _logger.info("Removing %d old officer poster job(s).", len(old))
+            old.unlink()
+
+    # ------------------------------------------------------------------
+    # Actions
+    # ------------------------------------------------------------------
+    def action_download(self):
+        self.ensure_one()
+        if not self.pdf_attachment_id:
+            raise UserError(_("This poster has not been generated yet."))
+        return {
+            'type': 'ir.actions.act_url',
+            'url': '/web/content/%s?download=true' % self.pdf_attachment_id.id,
+            'target': 'self',
+        }
+
+    def action_retry(self):
+        self.write({
+            'state': 'queued',
+            'attempts': 0,
+            'error_message': False,
+            'date_done': False,
+        })
+        self._trigger_worker()
@@ -2,28 +2,52 @@
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
+import base64
+import hashlib
+import logging
 
-def _lodge_year_selections(self):
-    """Generate selection list of lodge years (10 back, 5 forward).
-    Lodge year runs April 1 - March 31."""
-    import datetime
-    today = datetime.date.today()
-    current_start = today.year if today.month >= 4 else today.year - 1
-    years = []
-    for y in range(current_start - 10, current_start + 6):
-        label = f"{y}-{y + 1}"
-        years.append((label, label))
-    return years
-
-
-def _default_lodge_year(self):
-    """Return the current lodge year string, e.g. '2025-2026'."""
-    import datetime
-    today = datetime.date.today()
-    if today.month >= 4:
-        return f"{today.year}-{today.year + 1}"
-    else:
-        return f"{today.year - 1}-{today.year}"
+from .elks_lodge_year import (
+    SELECTION_YEARS_FORWARD,
+    current_lodge_year,
+    default_lodge_year as _default_lodge_year,
+    lodge_year_bounds_sql,
+    lodge_year_selection_range,
+    lodge_year_selections as _lodge_year_selections,  # noqa: F401 (re-exported)
+)
+
+_logger = logging.getLogger(__name__)
+
+#: How far back officer terms may go — past rosters are imported for
+#: PER / PDD histories, so this is much wider than the usual window.
+TERM_YEARS_BACK = 100
+
+
+#: Context value marking creates made by ``_create_history_terms``.  A
+#: module-level object rather than a flag, so it can't be passed in
+#: over RPC to skip the checks below.
+_HISTORY_IMPORT = object()
+
+
+def _term_lodge_year_selections(self=None):
+    """Selection list of lodge years for officer terms."""
+    return lodge_year_selection_range(TERM_YEARS_BACK, SELECTION_YEARS_FORWARD)
+
+
+#: Roster report sections, in print order.
+ROSTER_SECTIONS = [
+    ('elected', 'Elected Officers'),
+    ('trustee', 'Board of Trustees'),
+    ('appointed', 'Appointed Officers'),
+    ('staff', 'Staff / Administrative'),
+    ('honorific', 'Past / Honorific'),
+    ('delegate', 'Delegates'),
+]
+
+#: Website photo derivative widths (must match the image_<size> fields).
+PHOTO_SIZES = (128, 256, 512)
+
+#: Exclusion constraint backing ``_check_unique_position_per_year``.
+OVERLAP_CONSTRAINT = 'elks_officer_term_no_overlap'
 
 
 OFFICER_POSITIONS = [
@@ -90,6 +114,11 @@ class ElksOfficerTerm(models.Model):
     _description = "Elks Officer Term"
     _order = "lodge_year desc, position"
 
+    # "Who held position X in lodge year Y" — roster report, PER
+    # histories, website and the overlap check all filter on these.
+    _year_position_idx = models.Index(
+        '(lodge_year, position, active, x_is_vacated)')
+
     active = fields.Boolean(
         default=True,
         help="Uncheck to archive this term.  Archived terms remain in the "
@@ -106,7 +135,7 @@ class ElksOfficerTerm(models.Model):
         OFFICER_POSITIONS, string="Position", required=True, index=True,
     )
     lodge_year = fields.Selection(
-        selection=_lodge_year_selections,
+        selection=_term_lodge_year_selections,
         string="Lodge Year", required=True, index=True,
         default=_default_lodge_year,
         help="Lodge year (April 1 - March 31). Select from the list.",
@@ -143,6 +172,31 @@ class ElksOfficerTerm(models.Model):
         "Photo", max_width=1920, max_height=1920,
         help="Officer photo for website display. Not linked to the contact record.",
     )
+    # Sized derivatives, resized once on upload and stored (same
+    # pattern as image.mixin) so neither the public page nor the print
+    # builders (poster proxy, cards) decode the full 1920px original.
+    image_1024 = fields.Image(
+        "Photo 1024", related="image_1920",
+        max_width=1024, max_height=1024, store=True,
+    )
+    image_512 = fields.Image(
+        "Photo 512", related="image_1920",
+        max_width=512, max_height=512, store=True,
+    )
+    image_256 = fields.Image(
+        "Photo 256", related="image_1920",
+        max_width=256, max_height=256, store=True,
+    )
+    image_128 = fields.Image(
+        "Photo 128", related="image_1920",
+        max_width=128, max_height=128, store=True,
+    )
+    image_checksum = fields.Char(
+        "Photo Checksum", compute="_compute_image_checksum", store=True,
+        help="SHA-1 of the uploaded photo. Identifies it in the poster "
+             "tile cache and versions the website image URLs without "
+             "reading the photo itself.",
+    )
     officer_email = fields.Char(
         "Officer Email",
         help="Public email for this officer position (e.g. ER@lodge.com). "
@@ -205,6 +259,14 @@ class ElksOfficerTerm(models.Model):
              "Report and website will render this seat as Vacant.",
     )
 
+    @api.depends('image_1920')
+    def _compute_image_checksum(self):
+        for rec in self:
+            photo = rec.with_context(bin_size=False).image_1920
+            rec.image_checksum = (
+                hashlib.sha1(base64.b64decode(photo)).hexdigest()
+                if photo else False)
+
     @api.depends('x_vacated_date')
     def _compute_x_is_vacated(self):
         for rec in self:
@@ -323,7 +385,162 @@ class ElksOfficerTerm(models.Model):
             name = rec.partner_id.name or ''
             rec.display_name = f"{pos} - {name} ({rec.lodge_year})"
 
+    @api.model
+    def get_position_holders(self, position, lodge_year, limit=None):
+        """Who held ``position`` in ``lodge_year``: the active,
+        non-vacated terms, latest first.  Served by the composite
+        (lodge_year, position, active, x_is_vacated) index."""
+        return self.search([
+            ('lodge_year', '=', lodge_year),
+            ('position', '=', position),
+            ('active', '=', True),
+            ('x_is_vacated', '=', False),
+        ], order='id desc', limit=limit)
+
+    def _group_roster(self):
+        """Group this recordset for the roster report, in one pass::
+
+            [{'lodge_year': '2025-2026',
+              'sections': [{'type': 'elected',
+                            'label': 'Elected Officers',
+                            'terms': <elks.officer.term>}, ...]}, ...]
+
+        Years are newest first, sections follow ``ROSTER_SECTIONS``
+        (terms without a known type go last, as 'Uncategorized') and
+        empty sections are left out.
+        """
+        known = dict(ROSTER_SECTIONS)
+        by_year = {}
+        for term in self:
+            otype = term.officer_type if term.officer_type in known else False
+            by_year.setdefault(term.lodge_year, {}).setdefault(
+                otype, []).append(term.id)
+        result = []
+        for year in sorted(by_year, reverse=True):
+            buckets = by_year[year]
+            sections = [
+                {'type': otype, 'label': label,
+                 'terms': self.browse(buckets[otype])}
+                for otype, label in ROSTER_SECTIONS + [(False, 'Uncategorized')]
+                if otype in buckets
+            ]
+            result.append({'lodge_year': year, 'sections': sections})
+        return result
+
+    @api.model
+    def get_current_lodge_year(self):
+        """Return the current lodge year label.  Exposed for server
+        actions, which can't import the lodge-year helpers."""
+        return current_lodge_year(fields.Date.context_today(self))
+
+    def _website_photo_urls(self, display_px):
+        """Return ``{'src', 'srcset', 'sizes'}`` for this officer's photo
+        shown at ``display_px`` CSS pixels.
+
+        Uploaded photos are served from the stored 128/256/512px
+        derivatives; officers without a photo get the Elk avatar run
+        through the same sizes by ``/elkscontacts/avatar``.  ``src``
+        is the smallest derivative that still covers a 2x screen.
+        """
+        self.ensure_one()
+        if self.image_checksum:
+            # Keyed on the photo itself, so browser caches survive
+            # unrelated edits to the term.
+            url = '/web/image/elks.officer.term/%d/image_%%d?unique=%s' % (
+                self.id, self.image_checksum[:16])
+        else:
+            url = '/elkscontacts/avatar/%s/%%d' % (self.gender or 'male')
+        src_size = next(
+            (size for size in PHOTO_SIZES if size >= display_px * 2),
+            PHOTO_SIZES[-1])
+        return {
+            'src': url % src_size,
+            'srcset': ', '.join(
+                '%s %dw' % (url % size, size) for size in PHOTO_SIZES),
+            'sizes': '%dpx' % display_px,
+        }
+
+    @api.model
+    def _website_cache_stamp(self, lodge_year):
+        """Return a cheap fingerprint of everything the public officer
+        listing for ``lodge_year`` depends on: the terms themselves and
+        their members' names.  Any create / write / archive of a term,
+        or a write on one of its partners, changes the stamp, so
+        controllers can key caches and ETags on it without needing an
+        invalidation hook in every worker."""
+        self.flush_model()
+        self.env['res.partner'].flush_model(['name', 'write_date'])
+        self.env.cr.execute(f"""
+            SELECT count(t.id), max(t.write_date), max(p.write_date)
+              FROM {self._table} t
+              JOIN res_partner p ON p.id = t.partner_id
+             WHERE t.lodge_year = %s
+        """, (lodge_year,))
+        count, term_stamp, partner_stamp = self.env.cr.fetchone()
+        return f"{lodge_year}:{count}:{term_stamp}:{partner_stamp}"
+
     # ── Constraints ──────────────────────────────────────────
+    def init(self):
+        """Back the overlap check with a PostgreSQL exclusion constraint.
+
+        Two active, non-vacated terms for the same position and lodge
+        year may not have overlapping date windows (blank dates fall
+        back to the lodge-year bounds, exactly like the Python check).
+        The constraint is DEFERRABLE INITIALLY DEFERRED so the Python
+        check below still fires first with its readable message; the
+        constraint only catches what slips past it (concurrent
+        transactions, raw SQL imports).
+
+        Needs the ``btree_gist`` extension.  When it can't be created,
+        or existing data already overlaps, we log and rely on the
+        Python check alone.
+        """
+        cr = self.env.cr
+        year_start, year_end = lodge_year_bounds_sql('lodge_year')
+        cr.execute(f"""
+            CREATE OR REPLACE FUNCTION elks_officer_term_range(
+                date_start date, date_end date, lodge_year varchar)
+            RETURNS daterange
+            LANGUAGE sql IMMUTABLE AS $$
+                SELECT CASE WHEN s IS NULL OR e IS NULL OR s <= e
+                            THEN daterange(s, e, '[]') END
+                  FROM (SELECT COALESCE(date_start, {year_start}) AS s,
+                               COALESCE(date_end, {year_end}) AS e) b
+            $$
+        """)
+        cr.execute("""
+            SELECT 1 FROM pg_constraint
+             WHERE conname = %s AND conrelid = %s::regclass
+        """, (OVERLAP_CONSTRAINT, self._table))
+        if cr.fetchone():
+            return
+        try:
+            with cr.savepoint():
+                cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+                cr.execute(f"""
+                    ALTER TABLE {self._table}
+                      ADD CONSTRAINT {OVERLAP_CONSTRAINT}
+                      EXCLUDE USING gist (
+                          position WITH =,
+                          lodge_year WITH =,
+                          elks_officer_term_range(
+                              date_start, date_end, lodge_year) WITH &&
+                      )
+                      WHERE (active AND NOT COALESCE(x_is_vacated, false))
+                      DEFERRABLE INITIALLY DEFERRED
+                """)
+        except Exception as e:
+            _logger.warning(
+                "Officer term overlap exclusion constraint not created "
+                "(%s); overlaps are still checked in Python.", e,
+            )
+
+    def _flush_for_checks(self):
+        self.flush_model([
+            'partner_id', 'position', 'lodge_year', 'active',
+            'x_is_vacated', 'date_start', 'date_end',
+        ])
+
     @api.constrains('position', 'lodge_year', 'partial_year', 'active',
                     'x_vacated_date', 'date_start', 'date_end')
     def _check_unique_position_per_year(self):
@@ -339,98 +556,103 @@ class ElksOfficerTerm(models.Model):
         A missing ``date_start`` defaults to April 1 of the lodge year
         and a missing ``date_end`` defaults to March 31 of the next
         year, so a term with no dates behaves as a full-year term.
-        """
-        import datetime as _dt
-
-        def _bounds(term):
-            """Return (start, end) date bounds for the term. Fills in
-            April 1 -> March 31 defaults from lodge_year when either
-            side is blank."""
-            start = term.date_start
-            end = term.date_end
-            if not (start and end) and term.lodge_year:
-                try:
-                    y_start = int(term.lodge_year.split('-')[0])
-                    start = start or _dt.date(y_start, 4, 1)
-                    end = end or _dt.date(y_start + 1, 3, 31)
-                except (ValueError, IndexError):
-                    pass
-            return start, end
 
-        for rec in self:
-            if not rec.position or not rec.lodge_year or not rec.active:
-                continue
-            # Vacated terms are not "currently holding" — skip.
-            if rec.x_is_vacated:
-                continue
-            rec_start, rec_end = _bounds(rec)
-
-            # Look at every other active, non-vacated term for the
-            # same position + lodge year.
-            others = self.with_context(active_test=True).search([
-                ('id', '!=', rec.id),
-                ('position', '=', rec.position),
-                ('lodge_year', '=', rec.lodge_year),
-                ('active', '=', True),
-                ('x_is_vacated', '=', False),
-            ])
-            if not others:
-                continue
-
-            for other in others:
-                other_start, other_end = _bounds(other)
-                # Non-overlapping windows: rec ends before other starts
-                # OR other ends before rec starts.
-                if (rec_end and other_start and rec_end < other_start):
-                    continue
-                if (other_end and rec_start and other_end < rec_start):
-                    continue
-                # Overlap detected — block with a clear message that
-                # names the conflicting date range.
-                label = dict(OFFICER_POSITIONS).get(
-                    rec.position, rec.position)
-                raise ValidationError(_(
-                    "The position '%(pos)s' for lodge year %(yr)s "
-                    "overlaps an existing term held by %(other)s "
-                    "(%(o_start)s - %(o_end)s). Adjust the Term Start "
-                    "or Term End dates so the two windows don't "
-                    "overlap, mark the previous holder as vacated, or "
-                    "archive the previous term."
-                ) % {
-                    'pos': label,
-                    'yr': rec.lodge_year,
-                    'other': other.partner_id.display_name,
-                    'o_start': other_start or _('(no start)'),
-                    'o_end': other_end or _('(no end)'),
-                })
+        The whole batch is checked with one self-join, so creating a
+        full slate or importing years of history costs one query
+        instead of one per term.
+        """
+        # The officer history import validates the whole file in memory
+        # before creating, so it skips the per-batch check.
+        if not self.ids or self._in_history_import():
+            return
+        self._flush_for_checks()
+
+        def bounds(t):
+            start, end = lodge_year_bounds_sql(f'{t}.lodge_year')
+            return (f"COALESCE({t}.date_start, {start}) AS {t}_start, "
+                    f"COALESCE({t}.date_end, {end}) AS {t}_end")
+
+        self.env.cr.execute(f"""
+            SELECT r_id, o_id, o_start, o_end
+              FROM (
+                    SELECT r.id AS r_id, o.id AS o_id,
+                           {bounds('r')},
+                           {bounds('o')}
+                      FROM {self._table} r
+                      JOIN {self._table} o
+                        ON o.position = r.position
+                       AND o.lodge_year = r.lodge_year
+                       AND o.id <> r.id
+                       AND o.active
+                       AND NOT COALESCE(o.x_is_vacated, false)
+                     WHERE r.id IN %s
+                       AND r.active
+                       AND NOT COALESCE(r.x_is_vacated, false)
+                   ) pairs
+             WHERE NOT COALESCE(r_end < o_start, false)
+               AND NOT COALESCE(o_end < r_start, false)
+             ORDER BY r_id, o_id
+             LIMIT 1
+        """, (tuple(self.ids),))
+        row = self.env.cr.fetchone()
+        if not row:
+            return
+        rec_id, other_id, other_start, other_end = row
+        rec, other = self.browse(rec_id), self.browse(other_id)
+        # Overlap detected — block with a clear message that names the
+        # conflicting date range.
+        label = dict(OFFICER_POSITIONS).get(rec.position, rec.position)
+        raise ValidationError(_(
+            "The position '%(pos)s' for lodge year %(yr)s "
+            "overlaps an existing term held by %(other)s "
+            "(%(o_start)s - %(o_end)s). Adjust the Term Start "
+            "or Term End dates so the two windows don't "
+            "overlap, mark the previous holder as vacated, or "
+            "archive the previous term."
+        ) % {
+            'pos': label,
+            'yr': rec.lodge_year,
+            'other': other.partner_id.display_name,
+            'o_start': other_start or _('(no start)'),
+            'o_end': other_end or _('(no end)'),
+        })
 
     @api.constrains('partner_id', 'position', 'lodge_year')
     def _check_no_duplicate_member_position(self):
         """Prevent the same member from being assigned the same position
         twice in the same lodge year (regardless of partial_year flag).
-        Archived records are excluded from this check."""
-        for rec in self:
-            if not (rec.partner_id and rec.position and rec.lodge_year):
-                continue
-            if not rec.active:
-                continue
-            dupes = self.with_context(active_test=True).search([
-                ('partner_id', '=', rec.partner_id.id),
-                ('position', '=', rec.position),
-                ('lodge_year', '=', rec.lodge_year),
-                ('active', '=', True),
-                ('id', '!=', rec.id),
-            ])
-            if dupes:
-                label = dict(OFFICER_POSITIONS).get(rec.position, rec.position)
-                raise ValidationError(_(
-                    "%(member)s already holds the position of "
-                    "%(pos)s for lodge year %(yr)s."
-                ) % {
-                    'member': rec.partner_id.display_name,
-                    'pos': label,
-                    'yr': rec.lodge_year,
-                })
+        Archived records are excluded from this check.  One query for
+        the whole batch."""
+        if not self.ids or self._in_history_import():
+            return
+        self._flush_for_checks()
+        self.env.cr.execute(f"""
+            SELECT r.id
+              FROM {self._table} r
+              JOIN {self._table} o
+                ON o.partner_id = r.partner_id
+               AND o.position = r.position
+               AND o.lodge_year = r.lodge_year
+               AND o.id <> r.id
+               AND o.active
+             WHERE r.id IN %s
+               AND r.active
+             ORDER BY r.id
+             LIMIT 1
+        """, (tuple(self.ids),))
+        row = self.env.cr.fetchone()
+        if not row:
+            return
+        rec = self.browse(row[0])
+        label = dict(OFFICER_POSITIONS).get(rec.position, rec.position)
+        raise ValidationError(_(
+            "%(member)s already holds the position of "
+            "%(pos)s for lodge year %(yr)s."
+        ) % {
+            'member': rec.partner_id.display_name,
+            'pos': label,
+            'yr': rec.lodge_year,
+        })
 
     # ── Sync current officer position to contact ────────────
     def _sync_officer_position_to_partner(self):
@@ -439,25 +661,143 @@ class ElksOfficerTerm(models.Model):
         lodge year. Vacated terms are treated as "no longer holding"
         the position so the res.partner-side uniqueness constraint
         doesn't block backfilling the vacant seat."""
-        current_year = _default_lodge_year(self)
-        partners = self.mapped('partner_id')
+        self._sync_partner_officer_positions(self.mapped('partner_id'))
+
+    @api.model
+    def _sync_partner_officer_positions(self, partners):
+        """Bulk form of ``_sync_officer_position_to_partner``.
+
+        One ``DISTINCT ON`` query finds the latest current term of every
+        partner, partners are written in one batch per target position,
+        and the partner-side uniqueness check runs once at the end over
+        everyone who changed — so swapping two officers' seats in one
+        batch doesn't trip the check halfway through.  Returns
+        ``{partner_id: (old_position, new_position)}`` for the partners
+        that changed.
+        """
+        partners = partners.exists()
+        if not partners:
+            return {}
+        self.flush_model([
+            'partner_id', 'position', 'lodge_year', 'active', 'x_is_vacated',
+        ])
+        self.env.cr.execute(f"""
+            SELECT DISTINCT ON (partner_id) partner_id, position
+              FROM {self._table}
+             WHERE partner_id IN %s
+               AND lodge_year = %s
+               AND active
+               AND NOT COALESCE(x_is_vacated, false)
+             ORDER BY partner_id, id DESC
+        """, (tuple(partners.ids), _default_lodge_year(self)))
+        current = dict(self.env.cr.fetchall())
+
+        by_position = {}
+        changes = {}
         for partner in partners:
-            term = self.with_context(active_test=True).search([
-                ('partner_id', '=', partner.id),
-                ('lodge_year', '=', current_year),
-                ('active', '=', True),
-                ('x_is_vacated', '=', False),
-            ], order='id desc', limit=1)
-            new_pos = term.position if term else False
+            new_pos = current.get(partner.id, False)
             if partner.x_elks_officer_position != new_pos:
-                partner.write({'x_elks_officer_position': new_pos})
+                by_position.setdefault(new_pos, []).append(partner.id)
+                changes[partner.id] = (partner.x_elks_officer_position, new_pos)
+        if not by_position:
+            return changes
+        Partner = self.env['res.partner']._defer_officer_check()
+        changed = self.env['res.partner']
+        for new_pos, partner_ids in by_position.items():
+            Partner.browse(partner_ids).write(
+                {'x_elks_officer_position': new_pos})
+            changed |= changed.browse(partner_ids)
+        changed._check_unique_officer_position()
+        return changes
+
+    # ── Lodge-year rollover ──────────────────────────────────
+    ROLLOVER_PARAM = 'elkscontacts.officer_rollover_lodge_year'
+
+    @api.model
+    def cron_rollover_officer_positions(self, force=False):
+        """Runs daily: when the lodge year changes (April 1), recompute
+        x_elks_officer_position for every partner in one pass.
+
+        Partners who still show a position from last year and partners
+        holding a term in the new year go through the bulk sync
+        together, so stale positions are cleared and new ones set in
+        one write per position.  Returns ``{partner_id: (old, new)}``
+        for every partner that changed; the same is logged as a summary.
+        """
+        year = _default_lodge_year(self)
+        ICP = self.env['ir.config_parameter'].sudo()
+        if not force and ICP.get_param(self.ROLLOVER_PARAM) == year:
+            return {}
+
+        Partner = self.env['res.partner'].sudo().with_context(
+            active_test=False)
+        partners = Partner.search([('x_elks_officer_position', '!=', False)])
+        partners |= self.sudo().search([
+            ('lodge_year', '=', year),
+            ('x_is_vacated', '=', False),
+        ]).mapped('partner_id')
+        changes = self.sudo()._sync_partner_officer_positions(partners) or {}
+
+        ICP.set_param(self.ROLLOVER_PARAM, year)
+        labels = dict(OFFICER_POSITIONS)
+        for partner_id, (old, new) in changes.items():
+            _logger.info(
+                "Officer rollover %s: partner %d %s -> %s.", year, partner_id,
+                labels.get(old, old or '-'), labels.get(new, new or '-'),
+            )
+        _logger.info(
+            "Officer rollover %s: %d partner(s) checked, %d cleared, "
+            "%d assigned.", year, len(partners),
+            sum(1 for _old, new in changes.values() if not new),
+            sum(1 for _old, new in changes.values() if new),
+        )
+        return changes
+
+    @api.model
+    def action_rollover_officer_positions(self):
+        """Menu action: run the rollover now and report what changed."""
+        changes = self.cron_rollover_officer_positions(force=True)
+        cleared = sum(1 for _old, new in changes.values() if not new)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Officer Rollover'),
+                'message': _(
+                    '%(total)s contact(s) updated for lodge year %(yr)s: '
+                    '%(assigned)s assigned, %(cleared)s cleared.'
+                ) % {
+                    'total': len(changes),
+                    'yr': _default_lodge_year(self),
+                    'assigned': len(changes) - cleared,
+                    'cleared': cleared,
+                },
+                'type': 'success',
+                'sticky': False,
+            },
+        }
 
     @api.model_create_multi
     def create(self, vals_list):
         records = super().create(vals_list)
-        records._sync_officer_position_to_partner()
+        # The history import syncs every partner once at the end.
+        if not self._in_history_import():
+            records._sync_officer_position_to_partner()
         return records
 
+    def _in_history_import(self):
+        return self.env.context.get('elks_officer_import') is _HISTORY_IMPORT
+
+    @api.model
+    def _create_history_terms(self, vals_list):
+        """Create terms for the officer history import, which has
+        already checked ``vals_list`` for overlaps and duplicates
+        against the database and itself: the per-record constraints and
+        the partner sync are skipped (the caller syncs once at the
+        end).  Private — only reachable from server code."""
+        return self.with_context(
+            elks_officer_import=_HISTORY_IMPORT).create(vals_list)
+
     def write(self, vals):
         res = super().write(vals)
         # x_vacated_date drives x_is_vacated, so a vacate write needs
@@ -490,23 +830,15 @@ class ElksOfficerTerm(models.Model):
         This preserves history.  Only truly empty/erroneous records
         (created in the same session) can be deleted via the ORM.
         """
-        for rec in self:
-            if rec.create_date and rec.partner_id:
-                # Archive instead of deleting
-                rec.action_archive_term()
+        # Archive instead of deleting (one batched write + sync)
+        to_archive = self.filtered(lambda r: r.create_date and r.partner_id)
+        if to_archive:
+            to_archive.action_archive_term()
         # Filter out the ones we just archived
         remaining = self.filtered(lambda r: not r.partner_id)
         if remaining:
             partners = remaining.mapped('partner_id')
             res = super(ElksOfficerTerm, remaining).unlink()
-            current_year = _default_lodge_year(self)
-            for partner in partners:
-                term = self.search([
-                    ('partner_id', '=', partner.id),
-                    ('lodge_year', '=', current_year),
-                ], order='id desc', limit=1)
-                new_pos = term.position if term else False
-                if partner.x_elks_officer_position != new_pos:
-                    partner.write({'x_elks_officer_position': new_pos})
+            self._sync_partner_officer_positions(partners)
             return res
         return True
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-import datetime
-
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError
 
+from .elks_lodge_year import current_lodge_year_start
+
 
 TRAINING_AREAS = [
     ('kitchen', 'Kitchen'),
@@ -38,11 +38,8 @@ def _next_lodge_year_end(self=None):
     Accepts an optional ``self`` so Odoo can call it as a field default
     (Odoo passes the recordset as the first argument).
     """
-    today = datetime.date.today()
-    if today.month >= 4:
-        return datetime.date(today.year + 1, 4, 1)
-    else:
-        return datetime.date(today.year, 4, 1)
+    start = current_lodge_year_start()
+    return start.replace(year=start.year + 1)
 
 
 class ElksVolunteerTraining(models.Model):
@@ -1,22 +1,8 @@
-import datetime
-
 from odoo import _, api, fields, models
 
-
-def _current_lodge_year_start(today=None):
-    """Return April 1 of the current lodge year.
-
-    The Elks lodge year runs April 1 – March 31.
-    If today is Jan–Mar, we're still in the previous lodge year
-    (started April 1 of last calendar year).
-    If today is Apr–Dec, the current lodge year started April 1 of this year.
-    """
-    if today is None:
-        today = datetime.date.today()
-    if today.month >= 4:
-        return datetime.date(today.year, 4, 1)
-    else:
-        return datetime.date(today.year - 1, 4, 1)
+from .elks_lodge_year import (
+    current_lodge_year_start as _current_lodge_year_start,
+)
 
 
 class ResPartner(models.Model):
@@ -8,5 +8,8 @@ from . import volunteer_link_wizard
 from . import suspension_wizard
 from . import transfer_dimit_wizard
 from . import vacate_officer_wizard
+from . import officer_slate_copy_wizard
+from . import officer_history_import_wizard
 from . import volunteer_signup_wizard
 from . import officer_poster_wizard
+from . import officer_card_wizard
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Officer photo cards and name badges.
+
+Lays the lodge officers out N-up on US Letter pages, one card per
+officer, and writes them into a multi-page PDF for printing on card
+stock and cutting out:
+
+    card ....... 2.5" x 3.5" (trading card), 3 x 3 per page
+    badge ...... 3" x 4" (badge holder insert), 2 x 2 per page
+
+Each card is a lodge header strip (lodge name in gold, lodge year in
+white) above the same officer tile the poster uses — photo, Elks
+avatar fallback or "Position Vacant" graphic, gold frame and title bar
+— so both come from ``officer_poster_builder._render_tiles`` and share
+its tile cache, photo cache and thread pool.
+
+Officers are consumed lazily, one page at a time, and each page is
+JPEG-encoded into the PDF as soon as it is drawn, so memory stays flat
+however many cards are printed.  Like the poster builder this module
+has **no Odoo imports**.
+"""
+import io
+from itertools import islice
+
+from PIL import Image, ImageDraw
+
+from .officer_poster_builder import (
+    BLACK,
+    DEFAULT_WORKERS,
+    GOLD_BRIGHT,
+    TILE_CACHE,
+    WHITE,
+    _fit_font,
+    _load_font,
+    _render_tiles,
+    _write_image_pdf,
+)
+
+#: US Letter, portrait.
+PAGE_WIDTH_IN = 8.5
+PAGE_HEIGHT_IN = 11.0
+
+#: Card formats: size in inches, grid per page, gap between cards and
+#: the share of the card height taken by the lodge header strip.
+CARD_FORMATS = {
+    'card': {
+        'label': 'Photo Card (2.5" x 3.5", 9 per page)',
+        'width_in': 2.5, 'height_in': 3.5, 'cols': 3, 'rows': 3,
+        'gap_in': 0.0, 'header': 0.10,
+    },
+    'badge': {
+        'label': 'Name Badge (3" x 4", 4 per page)',
+        'width_in': 3.0, 'height_in': 4.0, 'cols': 2, 'rows': 2,
+        'gap_in': 0.25, 'header': 0.14,
+    },
+}
+
+PAPER = (255, 255, 255)
+CUT_LINE = (190, 190, 190)
+#: Cards are looked at up close, so encode pages above Pillow's default.
+CARD_JPEG_QUALITY = 90
+
+
+def _card_header(w, h, lodge_title, lodge_year, font_dir):
+    """Black strip with the lodge title (gold) over the year (white)."""
+    strip = Image.new('RGB', (w, h), BLACK)
+    d = ImageDraw.Draw(strip)
+    max_w = int(w * 0.92)
+    title_font = _fit_font(d, lodge_title, 'DejaVuSans-Bold.ttf', font_dir,
+                           max_w, int(h * 0.42), min_size=8)
+    year_font = _fit_font(d, lodge_year, 'DejaVuSansCondensed-Bold.ttf',
+                          font_dir, max_w, int(h * 0.30), min_size=8)
+    for text, font, fill, top in (
+            (lodge_title, title_font, GOLD_BRIGHT, 0.10),
+            (lodge_year, year_font, WHITE, 0.58)):
+        tw = d.textbbox((0, 0), text, font=font)[2]
+        d.text(((w - tw) // 2, int(h * top)), text, fill=fill, font=font)
+    return strip
+
+
+def _card_boxes(fmt, dpi):
+    """(x, y, w, h) of every card slot on a page, left to right, top to
+    bottom, with the grid centred on the page."""
+    cw, ch = int(fmt['width_in'] * dpi), int(fmt['height_in'] * dpi)
+    gap = int(fmt['gap_in'] * dpi)
+    cols, rows = fmt['cols'], fmt['rows']
+    x0 = (int(PAGE_WIDTH_IN * dpi) - cols * cw - (cols - 1) * gap) // 2
+    y0 = (int(PAGE_HEIGHT_IN * dpi) - rows * ch - (rows - 1) * gap) // 2
+    return [(x0 + c * (cw + gap), y0 + r * (ch + gap), cw, ch)
+            for r in range(rows) for c in range(cols)]
+
+
+def _card_pages(officers, fmt, lodge_title, lodge_year, font_dir, dpi,
+                img_dir, cache, workers, counter):
+    """Yield one ``(W, H, bands)`` page per ``cols x rows`` officers,
+    pulling officers from the iterable only as each page is drawn."""
+    W, H = int(PAGE_WIDTH_IN * dpi), int(PAGE_HEIGHT_IN * dpi)
+    boxes = _card_boxes(fmt, dpi)
+    _x, _y, cw, ch = boxes[0]
+    header_h = int(ch * fmt['header'])
+    header = _card_header(cw, header_h, lodge_title, lodge_year, font_dir)
+    tile_h = ch - header_h
+    fonts = {
+        'placeholder': _load_font(font_dir, 'DejaVuSans-Bold.ttf',
+                                  int(tile_h * 0.25)),
+        'vacant': _load_font(font_dir, 'DejaVuSans-Bold.ttf',
+                             int(tile_h * 0.12)),
+    }
+    cut = max(1, dpi // 150)
+
+    officers = iter(officers)
+    while True:
+        batch = list(islice(officers, len(boxes)))
+        if not batch:
+            return
+        placements = [((x, y + header_h, cw, tile_h), officer, True)
+                      for (x, y, _w, _h), officer in zip(boxes, batch)]
+        tiles = _render_tiles(placements, fonts, font_dir, img_dir=img_dir,
+                              cache=cache, workers=workers)
+        page = Image.new('RGB', (W, H), PAPER)
+        for (x, y, _w, _h), tile in zip(boxes, tiles):
+            page.paste(header, (x, y))
+            page.paste(tile, (x, y + header_h))
+        # Cut guides around every card, drawn after all cards so
+        # neighbouring cards (no gap) can't paint over them.
+        d = ImageDraw.Draw(page)
+        for x, y, _w, _h in boxes[:len(batch)]:
+            d.rectangle([x - cut, y - cut, x + cw + cut - 1, y + ch + cut - 1],
+                        outline=CUT_LINE, width=cut)
+        del tiles
+        counter[0] += len(batch)
+        yield W, H, [(0, page)]
+
+
+def build_officer_cards(officers, lodge_title, lodge_year, font_dir,
+                        card_format='card', dpi=300, img_dir=None, out=None,
+                        workers=DEFAULT_WORKERS, cache=TILE_CACHE):
+    """Build the officer cards as a multi-page Letter PDF.
+
+    officers: iterable of the same officer dicts as build_officer_poster,
+    in print order; it is only iterated one page at a time, so it can
+    be a generator that loads each photo when its card is reached.
+    card_format: a CARD_FORMATS key.
+    out: binary file to stream the PDF to; when None the PDF is built
+    in memory and returned.
+
+    Returns ``(pdf_bytes or None, page_count, card_count)``.
+    """
+    fmt = CARD_FORMATS[card_format]
+    target = out if out is not None else io.BytesIO()
+    counter = [0]
+    pages = _write_image_pdf(
+        target,
+        _card_pages(officers, fmt, lodge_title, lodge_year, font_dir, dpi,
+                    img_dir, cache, workers, counter),
+        dpi, jpeg_quality=CARD_JPEG_QUALITY)
+    return (target.getvalue() if out is None else None), pages, counter[0]
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Officer Photo Cards wizard.
+
+Prints one photo card or name badge per officer of a lodge year, N-up
+on Letter pages (``officer_card_builder``).  Officers are collected the
+same way as for the Officer Photo Poster — one per position, vacated
+positions shown as "Position Vacant" — but fed to the builder lazily,
+so each photo is only decoded when its page is drawn.  The PDF is
+spooled to a temporary file and stored as an ``ir.attachment`` in the
+filestore, downloaded through ``/web/content`` rather than a base64
+field on the wizard.
+"""
+import tempfile
+
+from odoo import fields, models, _
+from odoo.exceptions import UserError
+
+from ..models.elks_officer_term import _lodge_year_selections, _default_lodge_year
+from . import officer_card_builder as card_builder
+from .officer_poster_wizard import _FONT_DIR, _IMG_DIR
+
+#: Stored photo derivative (image_<size>) read for each card; covers a
+#: 3" tile at 300 DPI.
+CARD_PHOTO_SIZE = 1024
+
+
+class ElksOfficerCardWizard(models.TransientModel):
+    _name = "elks.officer.card.wizard"
+    _description = "Officer Photo Cards Generator"
+
+    lodge_year = fields.Selection(
+        selection=_lodge_year_selections,
+        string="Lodge Year", required=True,
+        default=_default_lodge_year,
+    )
+    card_format = fields.Selection(
+        [(key, fmt['label']) for key, fmt in card_builder.CARD_FORMATS.items()],
+        string="Format", default='card', required=True,
+    )
+    dpi = fields.Integer(
+        "Resolution (DPI)", default=300, required=True,
+        help="300 DPI is right for cards and badges, which are seen up "
+             "close.",
+    )
+    include_inactive = fields.Boolean("Include Archived Terms")
+    skip_vacant = fields.Boolean(
+        "Skip Vacant Positions", default=True,
+        help="Leave out positions that are currently vacant instead of "
+             "printing a \"Position Vacant\" card for them.",
+    )
+
+    # Results — the PDF lives in the filestore, not in a column.
+    cards_attachment_id = fields.Many2one(
+        "ir.attachment", string="Cards PDF", readonly=True,
+        ondelete="set null",
+    )
+    card_count = fields.Integer("Cards", readonly=True)
+    page_count = fields.Integer("Pages", readonly=True)
+    state = fields.Selection(
+        [('draft', 'Draft'), ('done', 'Generated')],
+        default='draft',
+    )
+
+    def action_generate(self):
+        self.ensure_one()
+        if self.dpi < 150 or self.dpi > 600:
+            raise UserError(_(
+                "Please choose a DPI between 150 and 600. 300 is "
+                "recommended for cards and badges."
+            ))
+        poster = self.env['elks.officer.poster.wizard'].new({
+            'lodge_year': self.lodge_year,
+            'include_inactive': self.include_inactive,
+        })
+        terms = poster._officer_terms()
+        if self.skip_vacant:
+            terms = terms.filtered(lambda t: not t.x_is_vacated)
+        if not terms:
+            raise UserError(_(
+                "No officer terms found for lodge year %s."
+            ) % self.lodge_year)
+
+        _emblem, lodge_name, lodge_number = poster._emblem_bytes()
+        lodge_title = "%s #%s" % (lodge_name, lodge_number) if lodge_number \
+            else (lodge_name or _("Elks Lodge"))
+
+        with tempfile.TemporaryFile() as spool:
+            _pdf, pages, cards = card_builder.build_officer_cards(
+                (poster._officer_entry(term, CARD_PHOTO_SIZE)
+                 for term in terms),
+                lodge_title=lodge_title,
+                lodge_year=self.lodge_year,
+                font_dir=_FONT_DIR,
+                img_dir=_IMG_DIR,
+                card_format=self.card_format,
+                dpi=self.dpi,
+                out=spool,
+            )
+            spool.seek(0)
+            attachment = self.env['ir.attachment'].create({
+                'name': "Officer_%s_%s_%s.pdf" % (
+                    'Badges' if self.card_format == 'badge' else 'Cards',
+                    lodge_number or 'lodge',
+                    (self.lodge_year or '').replace('/', '-'),
+                ),
+                'raw': spool.read(),
+                'mimetype': 'application/pdf',
+                'res_model': self._name,
+                'res_id': self.id,
+            })
+
+        old = self.cards_attachment_id
+        self.write({
+            'cards_attachment_id': attachment.id,
+            'card_count': cards,
+            'page_count': pages,
+            'state': 'done',
+        })
+        old.unlink()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+            'context': self.env.context,
+        }
+
+    def action_download(self):
+        self.ensure_one()
+        if not self.cards_attachment_id:
+            raise UserError(_("The cards have not been generated yet."))
+        return {
+            'type': 'ir.actions.act_url',
+            'url': '/web/content/%s?download=true' % self.cards_attachment_id.id,
+            'target': 'self',
+        }
+
+    def unlink(self):
+        # Transient records are vacuumed; take their PDFs with them.
+        self.cards_attachment_id.unlink()
+        return super().unlink()
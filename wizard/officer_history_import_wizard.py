@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Officer Term History Import Wizard.
+
+Loads past officer rosters (spreadsheets, CLMS exports) into
+elks.officer.term in bulk.  Expected CSV columns, matched
+case-insensitively and ignoring spaces / underscores:
+
+    Member Number   CLMS member number (required)
+    Position        position key or label, e.g. ``exalted_ruler`` or
+                    ``Exalted Ruler`` (required)
+    Lodge Year      ``2004-2005``, ``2004-05`` or ``2004`` (required)
+    Start Date      optional term start
+    End Date        optional term end
+    Partial Year    optional yes / no
+
+The whole file is resolved and validated in memory — partners in one
+query, overlaps / duplicates against the existing terms of the same
+lodge years in one more — and the surviving rows are created in
+batches through ``elks.officer.term._create_history_terms``, which
+skips the per-record constraint checks and partner sync.  The partner
+officer position sync runs once at the end.
+"""
+import base64
+import csv
+import io
+
+from odoo import fields, models, _
+from odoo.exceptions import UserError
+
+from ..models.elks_lodge_year import lodge_year_bounds
+from ..models.elks_officer_term import OFFICER_POSITIONS
+from .clms_import_wizard import ClmsImportWizard
+
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Map CSV column headers (case-insensitive, no spaces / underscores) →
+# row keys.
+COLUMN_MAP = {
+    'membernumber': 'member_num',
+    'membernum': 'member_num',
+    'detailmembernum': 'member_num',
+    'member': 'member_num',
+    'position': 'position',
+    'office': 'position',
+    'lodgeyear': 'lodge_year',
+    'year': 'lodge_year',
+    'startdate': 'date_start',
+    'termstart': 'date_start',
+    'datestart': 'date_start',
+    'enddate': 'date_end',
+    'termend': 'date_end',
+    'dateend': 'date_end',
+    'partialyear': 'partial_year',
+    'partial': 'partial_year',
+}
+
+#: Terms created per ORM ``create`` call.
+BATCH_SIZE = 500
+
+
+def _normalize_lodge_year(val):
+    """'2004-2005', '2004-05', '2004/05' or '2004' → '2004-2005'."""
+    val = (val or '').strip()
+    head = val[:4]
+    if not head.isdigit():
+        return False
+    start = int(head)
+    return f"{start}-{start + 1}"
+
+
+def _windows_overlap(a, b):
+    """Same rule as ElksOfficerTerm._check_unique_position_per_year:
+    windows overlap unless one ends before the other starts."""
+    (a_start, a_end), (b_start, b_end) = a, b
+    if a_end and b_start and a_end < b_start:
+        return False
+    if b_end and a_start and b_end < a_start:
+        return False
+    return True
+
+
+class ElksOfficerHistoryImportWizard(models.TransientModel):
+    _name = "elks.officer.history.import.wizard"
+    _description = "Officer Term History Import"
+
+    file_data = fields.Binary("Officer History CSV", required=True)
+    file_name = fields.Char("Filename")
+
+    state = fields.Selection([
+        ('setup', 'Setup'),
+        ('done', 'Done'),
+    ], default='setup')
+    result_message = fields.Text("Import Results", readonly=True)
+
+    def action_import(self):
+        self.ensure_one()
+        if not self.file_data:
+            raise UserError(_("Please upload an officer history CSV file."))
+
+        raw = base64.b64decode(self.file_data)
+        try:
+            content = raw.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            content = raw.decode('latin-1')
+
+        result = self._import_history(content)
+        self.write({
+            'state': 'done',
+            'result_message': result,
+        })
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "target": "new",
+        }
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+    def _read_rows(self, content, errors):
+        """Parse the CSV into ``[(line_no, row_dict)]``; bad rows are
+        reported in ``errors`` and dropped."""
+        reader = csv.DictReader(io.StringIO(content))
+        if not reader.fieldnames:
+            raise UserError(_("Empty or invalid CSV file."))
+        col_map = {}
+        for col in reader.fieldnames:
+            key = (col or '').strip().lower().replace('_', '').replace(' ', '')
+            if key in COLUMN_MAP:
+                col_map[col] = COLUMN_MAP[key]
+        missing = {'member_num', 'position', 'lodge_year'} - set(col_map.values())
+        if missing:
+            raise UserError(_(
+                "Missing required column(s): %(missing)s.\nFound: %(found)s"
+            ) % {
+                'missing': ", ".join(sorted(missing)),
+                'found': ", ".join(reader.fieldnames),
+            })
+
+        positions = {}
+        for key, label in OFFICER_POSITIONS:
+            positions[key] = key
+            positions[label.lower()] = key
+
+        rows = []
+        for line_no, raw in enumerate(reader, start=2):
+            row = {}
+            for csv_col, key in col_map.items():
+                row[key] = (raw.get(csv_col) or '').strip()
+            if not any(row.values()):
+                continue
+            if not row.get('member_num'):
+                errors.append(f"Row {line_no}: no member number.")
+                continue
+            position = positions.get(row['position'].lower()) or \
+                positions.get(row['position'].lower().replace(' ', '_'))
+            if not position:
+                errors.append(
+                    f"Row {line_no}: unknown position '{row['position']}'.")
+                continue
+            lodge_year = _normalize_lodge_year(row['lodge_year'])
+            if not lodge_year:
+                errors.append(
+                    f"Row {line_no}: bad lodge year '{row['lodge_year']}'.")
+                continue
+            rows.append((line_no, {
+                'member_num': row['member_num'],
+                'position': position,
+                'lodge_year': lodge_year,
+                'date_start': ClmsImportWizard._parse_date(
+                    row.get('date_start')),
+                'date_end': ClmsImportWizard._parse_date(
+                    row.get('date_end')),
+                'partial_year': (row.get('partial_year') or '').lower() in (
+                    'true', '1', 'yes', 'y', 't', 'x'),
+            }))
+        return rows
+
+    # ------------------------------------------------------------------
+    # Import
+    # ------------------------------------------------------------------
+    def _import_history(self, content):
+        errors = []
+        rows = self._read_rows(content, errors)
+        Term = self.env['elks.officer.term']
+        valid_years = set(Term._fields['lodge_year'].get_values(self.env))
+
+        # Resolve every member number in one query.
+        Partner = self.env['res.partner'].with_context(active_test=False)
+        nums = {r['member_num'] for _line, r in rows}
+        by_num = {}
+        for partner in Partner.search([('x_detail_member_num', 'in', list(nums))]):
+            by_num.setdefault(partner.x_detail_member_num.strip(), partner.id)
+
+        # Existing active, non-vacated terms of the same lodge years,
+        # in one query, as the starting point for overlap checks.
+        years = {r['lodge_year'] for _line, r in rows}
+        windows = {}      # (position, lodge_year) -> [((start, end), who)]
+        held = set()      # (partner_id, position, lodge_year)
+        for term in Term.search([
+                ('lodge_year', 'in', list(years)),
+                ('active', '=', True)]):
+            held.add((term.partner_id.id, term.position, term.lodge_year))
+            if not term.x_is_vacated:
+                windows.setdefault((term.position, term.lodge_year), []).append(
+                    (self._bounds(term.date_start, term.date_end,
+                                  term.lodge_year),
+                     term.partner_id.display_name))
+
+        vals_list = []
+        duplicates = 0
+        for line_no, r in rows:
+            if r['lodge_year'] not in valid_years:
+                errors.append(
+                    f"Row {line_no}: lodge year {r['lodge_year']} is out of "
+                    f"range.")
+                continue
+            partner_id = by_num.get(r['member_num'])
+            if not partner_id:
+                errors.append(
+                    f"Row {line_no}: no contact with member number "
+                    f"{r['member_num']}.")
+                continue
+            key = (partner_id, r['position'], r['lodge_year'])
+            if key in held:
+                duplicates += 1
+                continue
+            window = self._bounds(r['date_start'], r['date_end'],
+                                  r['lodge_year'])
+            group = windows.setdefault((r['position'], r['lodge_year']), [])
+            clash = next(
+                (who for other, who in group
+                 if _windows_overlap(window, other)), None)
+            if clash:
+                errors.append(
+                    f"Row {line_no}: {r['position']} {r['lodge_year']} "
+                    f"overlaps the term held by {clash}.")
+                continue
+            held.add(key)
+            group.append((window, r['member_num']))
+            vals_list.append({
+                'partner_id': partner_id,
+                'position': r['position'],
+                'lodge_year': r['lodge_year'],
+                'date_start': r['date_start'],
+                'date_end': r['date_end'],
+                'partial_year': r['partial_year'],
+                'show_on_website': False,
+            })
+
+        created = Term
+        for i in range(0, len(vals_list), BATCH_SIZE):
+            created |= Term._create_history_terms(vals_list[i:i + BATCH_SIZE])
+            _logger.info("Officer history import: %d / %d term(s) created.",
+                         len(created), len(vals_list))
+        if created:
+            Term._sync_partner_officer_positions(created.mapped('partner_id'))
+
+        parts = [
+            f"OFFICER HISTORY IMPORT RESULTS: {len(created)} term(s) created "
+            f"from {len(rows)} row(s)"
+        ]
+        if duplicates:
+            parts.append(f"\nSkipped {duplicates} row(s) already on file.")
+        if errors:
+            parts.append(f"\n--- ERRORS ({len(errors)}) ---")
+            parts.extend(f"  {e}" for e in errors)
+        return "\n".join(parts)
+
+    @staticmethod
+    def _bounds(date_start, date_end, lodge_year):
+        """Fill blank term dates with the lodge-year bounds, like the
+        term overlap constraint does."""
+        if not (date_start and date_end):
+            y_start, y_end = lodge_year_bounds(lodge_year)
+            date_start = date_start or y_start
+            date_end = date_end or y_end
+        return date_start, date_end
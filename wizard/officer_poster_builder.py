@@ -16,9 +16,29 @@ officer's name (gold, bold) and title (white).
 
 The default canvas is 47" x 29" at 150 DPI (7050 x 4350 px), saved as a
 single-page PDF whose physical page size is exactly 47" x 29".
+
+Rendered tiles are kept in a process-wide, content-addressed LRU cache
+(``TILE_CACHE``) keyed by photo hash, tile size, name, label, vacancy
+and fonts, so regenerating the poster after tweaking the term list
+only redraws the tiles whose inputs actually changed.  Cache misses are
+rendered concurrently in a thread pool (Pillow releases the GIL for
+decode / resize) and pasted onto the canvas serially.
+
+Above ``MAX_CANVAS_PIXELS`` (e.g. 300 DPI, ~14100 x 8700 px) the page
+is rendered in horizontal strips that are JPEG-encoded into the PDF one
+at a time, and the PNG preview is always rendered from the same layout
+at ``PREVIEW_RENDER_DPI`` rather than resized from the full canvas.
+``build_poster_proxy`` renders the same layout at ``PROXY_DPI`` for
+interactive setup; pixel floors in the tile geometry scale with the DPI
+(``_px``), so the proxy has the final poster's proportions.
 """
+import hashlib
 import io
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -37,6 +57,8 @@ PLACEHOLDER_FG = (120, 128, 145)
 # caption for the visual cue.
 VACANT_BG = (28, 28, 32)
 VACANT_FG = (220, 60, 80)
+VACANT_DASH = 12       # degrees per dash of the vacant circle
+VACANT_DASH_GAP = 6    # degrees between dashes
 
 # Position grouping ----------------------------------------------------
 KNIGHTS = ['leading_knight', 'loyal_knight', 'lecturing_knight']
@@ -46,8 +68,89 @@ TRUSTEES = ['boardchair', 'trustee1y', 'trustee2y',
 TOP_ROW = ['treasurer', 'exalted_ruler', 'secretary']
 
 
+class TileCache:
+    """Thread-safe LRU cache of rendered tiles, bounded by total pixel
+    memory (RGB, 3 bytes / pixel) rather than entry count — one 150 DPI
+    hero tile weighs as much as a dozen small ones."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _weight(img):
+        return img.size[0] * img.size[1] * 3
+
+    def get(self, key):
+        with self._lock:
+            img = self._entries.get(key)
+            if img is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return img
+
+    def put(self, key, img):
+        weight = self._weight(img)
+        if weight > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= self._weight(old)
+            self._entries[key] = img
+            self._bytes += weight
+            while self._bytes > self.max_bytes:
+                _key, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._weight(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+#: Canvases larger than this (~120 MB of RGB; 150 DPI is ~31 M px) are
+#: rendered and encoded in horizontal strips instead of all at once.
+MAX_CANVAS_PIXELS = 40000000
+#: Height of one strip in banded mode, in inches (rounded down to a
+#: multiple of 16 px so JPEG blocks never straddle two strips).
+BAND_HEIGHT_IN = 2.0
+#: The preview PNG is rendered at this DPI, then scaled to PREVIEW_WIDTH.
+PREVIEW_RENDER_DPI = 72
+PREVIEW_WIDTH = 1600
+#: Resolution of the quick layout proxy (build_poster_proxy) shown
+#: while the poster is being set up.
+PROXY_DPI = 20
+
+#: Shared across poster generations in this process (~160 MB of tiles,
+#: i.e. a couple of full 150 DPI posters).
+TILE_CACHE = TileCache(max_bytes=160 * 1024 * 1024)
+
+#: Distinct (font, size) pairs kept loaded; a poster uses a few dozen.
+FONT_CACHE_SIZE = 256
+
+#: Decoded, pre-shrunk officer photos keyed by a hash of their bytes, so
+#: a photo is decoded once for the preview, the print render and any
+#: second office the same member holds.
+PHOTO_CACHE = TileCache(max_bytes=64 * 1024 * 1024)
+#: Photos are decoded / reduced to no less than this multiple of the
+#: tile size, leaving the final LANCZOS pass enough pixels to work with.
+PHOTO_OVERSAMPLE = 2
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
 def _load_font(font_dir, filename, size):
-    """Load a bundled TrueType font; fall back to PIL default on failure."""
+    """Load a bundled TrueType font; fall back to PIL default on failure.
+    Cached per (font_dir, filename, size) for the life of the process."""
     try:
         return ImageFont.truetype(os.path.join(font_dir, filename), size)
     except Exception:
@@ -69,6 +172,48 @@ def _open_photo(photo_bytes):
         return None
 
 
+def _shrunk_photo(photo_bytes, target_w, target_h, cache=PHOTO_CACHE,
+                  key=None):
+    """Return an RGB image of ``photo_bytes`` big enough to cover-crop
+    to target_w x target_h, or None.
+
+    Instead of decoding phone photos at full resolution, JPEGs are
+    decoded at 1/2 .. 1/8 scale with ``draft()`` and anything still well
+    over the target is ``reduce()``d, keeping PHOTO_OVERSAMPLE x the
+    target in both directions.  The result is cached per photo (under
+    ``key``, e.g. a stored checksum, or a hash of the bytes) and reused
+    for every tile it is still big enough for.
+    """
+    if not photo_bytes:
+        return None
+    need_w = int(target_w) * PHOTO_OVERSAMPLE
+    need_h = int(target_h) * PHOTO_OVERSAMPLE
+    if cache is not None:
+        key = key or hashlib.sha1(photo_bytes).hexdigest()
+        img = cache.get(key)
+        if img is not None and (
+                img.size == img.info.get('source_size')
+                or (img.width >= need_w and img.height >= need_h)):
+            return img
+    try:
+        img = Image.open(io.BytesIO(photo_bytes))
+        source_size = img.size
+        if img.format == 'JPEG':
+            img.draft('RGB', (need_w, need_h))
+        img.load()
+        img = img.convert('RGB')
+    except Exception:
+        return None
+    factor = min(img.width // need_w, img.height // need_h)
+    if factor >= 2:
+        img = img.reduce(factor)
+    # Unshrunk photos can't get any bigger; reuse them for every size.
+    img.info['source_size'] = source_size
+    if cache is not None:
+        cache.put(key, img)
+    return img
+
+
 def _cover_crop(img, target_w, target_h):
     """Scale + center-crop an image to exactly fill target box (like CSS
     background-size: cover)."""
@@ -138,33 +283,37 @@ def _vacant_tile(target_w, target_h, position_label, fonts,
     target_w, target_h = int(target_w), int(target_h)
     tile = Image.new('RGB', (target_w, target_h), VACANT_BG)
     d = ImageDraw.Draw(tile)
-
-    # Circle radius scaled to tile WIDTH (portrait tiles are narrower
-    # than they are tall — sizing to min(w, h) would clip the sides
-    # or leave the circle floating). Then position it in the upper
-    # half of the tile so the caption + gold title bar fit below.
-    r = int(target_w * 0.28)
-    cx = target_w // 2
-    cy = int(target_h * 0.38)
-    stroke = max(3, r // 12)
+    g = _vacant_geometry(d, target_w, target_h, fonts, font_dir)
+    cx, cy, r, stroke = g['cx'], g['cy'], g['r'], g['stroke']
 
     # Dashed red circle: Pillow has no dashed-stroke primitive, so
     # emulate it by drawing short arc segments around the perimeter.
-    seg = 12   # degrees per dash
-    gap = 6    # degrees between dashes
     a = 0
     while a < 360:
         d.arc([cx - r, cy - r, cx + r, cy + r],
-              start=a, end=a + seg,
+              start=a, end=a + VACANT_DASH,
               fill=VACANT_FG, width=stroke)
-        a += seg + gap
+        a += VACANT_DASH + VACANT_DASH_GAP
 
     # X in the middle of the circle
+    for line in g['x_lines']:
+        d.line(line, fill=VACANT_FG, width=stroke)
+
+    d.text(g['caption_xy'], g['caption'], fill=VACANT_FG, font=g['font'])
+    return tile
+
+
+def _vacant_geometry(draw, target_w, target_h, fonts, font_dir=None):
+    """Shapes of the 'Position Vacant' graphic in tile pixels, shared by
+    the raster tile and the vector poster engine."""
+    # Circle radius scaled to tile WIDTH (portrait tiles are narrower
+    # than they are tall — sizing to min(w, h) would clip the sides
+    # or leave the circle floating). Then position it in the upper
+    # half of the tile so the caption + gold title bar fit below.
+    r = int(target_w * 0.28)
+    cx = target_w // 2
+    cy = int(target_h * 0.38)
     x_off = int(r * 0.45)
-    d.line([(cx - x_off, cy - x_off), (cx + x_off, cy + x_off)],
-           fill=VACANT_FG, width=stroke)
-    d.line([(cx - x_off, cy + x_off), (cx + x_off, cy - x_off)],
-           fill=VACANT_FG, width=stroke)
 
     # 'VACANT' caption sized to fit within the tile width, sits just
     # below the circle. _fit_font shrinks the font if the string is
@@ -172,18 +321,25 @@ def _vacant_tile(target_w, target_h, position_label, fonts,
     # can't overflow the tile edges.
     txt = "VACANT"
     caption_max_w = int(target_w * 0.85)
-    start_size = max(18, int(target_h * 0.09))
+    start_size = max(_px(fonts, 18), int(target_h * 0.09))
     if font_dir is not None:
-        f = _fit_font(d, txt, 'DejaVuSans-Bold.ttf', font_dir,
-                      caption_max_w, start_size, min_size=14)
+        f = _fit_font(draw, txt, 'DejaVuSans-Bold.ttf', font_dir,
+                      caption_max_w, start_size, min_size=_px(fonts, 14))
     else:
         f = fonts.get('vacant') or fonts['placeholder']
-    bbox = d.textbbox((0, 0), txt, font=f)
+    bbox = draw.textbbox((0, 0), txt, font=f)
     tw = bbox[2] - bbox[0]
     caption_y = cy + r + int(target_h * 0.03)
-    d.text((cx - tw / 2 - bbox[0], caption_y),
-           txt, fill=VACANT_FG, font=f)
-    return tile
+    return {
+        'cx': cx, 'cy': cy, 'r': r, 'stroke': max(_px(fonts, 3), r // 12),
+        'x_lines': [
+            [(cx - x_off, cy - x_off), (cx + x_off, cy + x_off)],
+            [(cx - x_off, cy + x_off), (cx + x_off, cy - x_off)],
+        ],
+        'caption': txt,
+        'caption_xy': (cx - tw / 2 - bbox[0], caption_y),
+        'font': f,
+    }
 
 
 def _placeholder(target_w, target_h, name, fonts):
@@ -191,35 +347,89 @@ def _placeholder(target_w, target_h, name, fonts):
     target_w, target_h = int(target_w), int(target_h)
     tile = Image.new('RGB', (target_w, target_h), PLACEHOLDER_BG)
     d = ImageDraw.Draw(tile)
+    g = _placeholder_geometry(d, target_w, target_h, name, fonts)
+    cx, cy, r = g['cx'], g['cy'], g['r']
+    d.ellipse([cx - r, cy - r, cx + r, cy + r], outline=PLACEHOLDER_FG,
+              width=g['stroke'])
+    d.text(g['text_xy'], g['text'], fill=PLACEHOLDER_FG, font=g['font'])
+    return tile
+
+
+def _placeholder_geometry(draw, target_w, target_h, name, fonts):
+    """Circle and initials of the placeholder tile, in tile pixels."""
     r = int(min(target_w, target_h) * 0.28)
     cx, cy = target_w // 2, int(target_h * 0.42)
-    d.ellipse([cx - r, cy - r, cx + r, cy + r], outline=PLACEHOLDER_FG, width=max(3, r // 18))
     txt = _initials(name)
     f = fonts['placeholder']
-    bbox = d.textbbox((0, 0), txt, font=f)
+    bbox = draw.textbbox((0, 0), txt, font=f)
     tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    d.text((cx - tw / 2 - bbox[0], cy - th / 2 - bbox[1]), txt,
-           fill=PLACEHOLDER_FG, font=f)
-    return tile
+    return {
+        'cx': cx, 'cy': cy, 'r': r, 'stroke': max(_px(fonts, 3), r // 18),
+        'text': txt,
+        'text_xy': (cx - tw / 2 - bbox[0], cy - th / 2 - bbox[1]),
+        'font': f,
+    }
+
+
+def _px(fonts, px):
+    """A pixel floor tuned at 150 DPI, scaled to the layout's DPI
+    (``fonts['scale']``) so low-DPI renders keep the same proportions."""
+    return max(1, int(round(px * fonts.get('scale', 1.0))))
 
 
 def _fit_font(draw, text, base_font_path, font_dir, max_w, start_size, min_size=14):
-    """Return a font sized so `text` fits within max_w (shrinks if needed)."""
-    size = start_size
-    while size > min_size:
-        f = _load_font(font_dir, base_font_path, size)
-        if draw.textlength(text, font=f) <= max_w:
-            return f
-        size -= 2
-    return _load_font(font_dir, base_font_path, min_size)
+    """Return a font sized so `text` fits within max_w (shrinks if needed).
+
+    Binary search for the largest size in [min_size, start_size] that
+    fits, so a tile caption costs a handful of measurements; min_size is
+    returned when nothing fits."""
+    def fits(size):
+        font = _load_font(font_dir, base_font_path, size)
+        return draw.textlength(text, font=font) <= max_w
+
+    if start_size > min_size and fits(start_size):
+        return _load_font(font_dir, base_font_path, start_size)
+    lo, hi = min_size, start_size - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+    return _load_font(font_dir, base_font_path, lo)
 
 
-def _draw_tile(canvas, box, officer, fonts, font_dir, emphasize=False,
-               img_dir=None):
-    """Render one officer photo tile with title bar into `box` on canvas.
+def _tile_key(w, h, officer, fonts, font_dir, emphasize, img_dir):
+    """Content address of a rendered tile: everything _render_tile
+    reads.  Photos are identified by ``photo_hash`` when the caller
+    has one stored, otherwise by a hash of their bytes."""
+    photo = officer.get('photo')
+    if officer.get('is_vacated'):
+        source = ('vacant',)
+    elif photo:
+        source = ('photo', officer.get('photo_hash')
+                  or hashlib.sha1(photo).hexdigest())
+    else:
+        # Avatar fallback (or initials when the avatar file is missing).
+        source = ('avatar', img_dir,
+                  'female' if str(officer.get('gender') or '').lower()
+                  == 'female' else 'male')
+    return (
+        w, h, source,
+        officer.get('name') or '', officer.get('position_label') or '',
+        bool(emphasize), font_dir,
+        getattr(fonts.get('placeholder'), 'size', None),
+        fonts.get('scale', 1.0),
+    )
+
+
+def _render_tile(w, h, officer, fonts, font_dir, emphasize=False,
+                 img_dir=None, photo_cache=PHOTO_CACHE):
+    """Render one officer photo tile with title bar; returns the RGB
+    tile image (w x h).  Shrunk photos are kept in ``photo_cache``
+    (None to keep nothing).
 
-    box = (x, y, w, h).  officer = dict(name, position_label, photo,
-    gender, is_vacated).
+    officer = dict(name, position_label, photo, gender, is_vacated).
 
     Photo resolution priority:
       1. Vacated position -> "Position Vacant" placeholder tile.
@@ -228,17 +438,19 @@ def _draw_tile(canvas, box, officer, fonts, font_dir, emphasize=False,
          the public website officer page).
       4. Avatar file missing -> initials-in-circle fallback.
     """
-    x, y, w, h = (int(v) for v in box)
     name = officer.get('name') or ''
     title = officer.get('position_label') or ''
 
     if officer.get('is_vacated'):
         tile = _vacant_tile(w, h, title, fonts, font_dir=font_dir)
     else:
-        photo = _open_photo(officer.get('photo'))
+        photo = _shrunk_photo(officer.get('photo'), w, h,
+                              cache=photo_cache,
+                              key=officer.get('photo_hash'))
         if photo is None:
-            avatar = _open_photo(
-                _load_avatar_bytes(img_dir, officer.get('gender')),
+            avatar = _shrunk_photo(
+                _load_avatar_bytes(img_dir, officer.get('gender')), w, h,
+                cache=photo_cache,
             )
             if avatar is not None:
                 photo = avatar
@@ -249,35 +461,115 @@ def _draw_tile(canvas, box, officer, fonts, font_dir, emphasize=False,
 
     # Gold frame
     frame = Image.new('RGB', (w, h), GOLD)
-    pad = max(4, int(min(w, h) * 0.012))
+    pad = _tile_pad(w, h, fonts)
     inner = tile.resize((w - 2 * pad, h - 2 * pad), Image.LANCZOS)
     frame.paste(inner, (pad, pad))
     tile = frame
 
     # Title bar across the lower edge
-    bar_h = max(56, int(h * (0.20 if emphasize else 0.17)))
-    bar = Image.new('RGBA', (w, bar_h), BAR_RGBA)
+    d = ImageDraw.Draw(tile)
+    bar = _title_bar_geometry(d, w, h, name, title, fonts, font_dir,
+                              emphasize)
+    bar_img = Image.new('RGBA', (w, bar['bar_h']), BAR_RGBA)
     tile_rgba = tile.convert('RGBA')
-    tile_rgba.alpha_composite(bar, (0, h - bar_h))
+    tile_rgba.alpha_composite(bar_img, (0, h - bar['bar_h']))
     tile = tile_rgba.convert('RGB')
 
     d = ImageDraw.Draw(tile)
+    d.text(bar['name_xy'], name, fill=GOLD_BRIGHT, font=bar['name_font'])
+    d.text(bar['title_xy'], title, fill=WHITE, font=bar['title_font'])
+    return tile
+
+
+def _tile_pad(w, h, fonts):
+    """Width of the gold frame around a tile's photo."""
+    return max(_px(fonts, 4), int(min(w, h) * 0.012))
+
+
+def _title_bar_geometry(draw, w, h, name, title, fonts, font_dir,
+                        emphasize=False):
+    """Height of the translucent title bar and the position / font of
+    the name and title captions on it, in tile pixels."""
+    pad = _tile_pad(w, h, fonts)
+    bar_h = max(_px(fonts, 56), int(h * (0.20 if emphasize else 0.17)))
+    min_size = _px(fonts, 14)
     inner_w = w - 2 * pad - int(w * 0.04)
     tx = pad + int(w * 0.02)
 
     name_size = int(bar_h * (0.42 if emphasize else 0.40))
     title_size = int(bar_h * (0.30 if emphasize else 0.30))
-    name_font = _fit_font(d, name, 'DejaVuSans-Bold.ttf', font_dir,
-                          inner_w, name_size)
-    title_font = _fit_font(d, title, 'DejaVuSansCondensed-Bold.ttf', font_dir,
-                           inner_w, title_size)
+    return {
+        'bar_h': bar_h,
+        'name_font': _fit_font(draw, name, 'DejaVuSans-Bold.ttf', font_dir,
+                               inner_w, name_size, min_size),
+        'title_font': _fit_font(draw, title, 'DejaVuSansCondensed-Bold.ttf',
+                                font_dir, inner_w, title_size, min_size),
+        'name_xy': (tx, h - bar_h + int(bar_h * 0.12)),
+        'title_xy': (tx, h - bar_h + int(bar_h * 0.56)),
+    }
+
+
+#: Default tile-rendering threads; tiles are few and large, so a
+#: handful of workers is enough to keep the cores busy.
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _cached_tile(w, h, officer, fonts, font_dir, emphasize=False,
+                 img_dir=None, cache=TILE_CACHE):
+    """Return the tile for these inputs from ``cache``, rendering (and
+    storing) it on a miss.  ``cache=None`` renders every tile and keeps
+    neither the tile nor its shrunk photo.  Safe to call from worker
+    threads."""
+    key = None
+    if cache is not None:
+        key = _tile_key(w, h, officer, fonts, font_dir, emphasize, img_dir)
+        tile = cache.get(key)
+        if tile is not None:
+            return tile
+    tile = _render_tile(w, h, officer, fonts, font_dir,
+                        emphasize=emphasize, img_dir=img_dir,
+                        photo_cache=PHOTO_CACHE if cache is not None else None)
+    if cache is not None:
+        cache.put(key, tile)
+    return tile
+
 
-    name_y = h - bar_h + int(bar_h * 0.12)
-    title_y = h - bar_h + int(bar_h * 0.56)
-    d.text((tx, name_y), name, fill=GOLD_BRIGHT, font=name_font)
-    d.text((tx, title_y), title, fill=WHITE, font=title_font)
+def _render_tiles(placements, fonts, font_dir, img_dir=None,
+                  cache=TILE_CACHE, workers=DEFAULT_WORKERS):
+    """Return the tiles for ``placements`` = [(box, officer, emphasize)],
+    in order, rendered on ``workers`` threads."""
+    def render(placement):
+        (_x, _y, w, h), officer, emphasize = placement
+        return _cached_tile(int(w), int(h), officer, fonts, font_dir,
+                            emphasize=emphasize, img_dir=img_dir,
+                            cache=cache)
 
-    canvas.paste(tile, (x, y))
+    if workers and workers > 1 and len(placements) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(render, placements))
+    return [render(p) for p in placements]
+
+
+def _draw_tiles(canvas, placements, fonts, font_dir, img_dir=None,
+                cache=TILE_CACHE, workers=DEFAULT_WORKERS):
+    """Render ``placements`` and paste them onto canvas.  Rendering runs
+    on ``workers`` threads; pasting stays on the calling thread, in
+    order."""
+    tiles = _render_tiles(placements, fonts, font_dir, img_dir=img_dir,
+                          cache=cache, workers=workers)
+    for ((x, y, _w, _h), _officer, _emphasize), tile in zip(placements, tiles):
+        canvas.paste(tile, (int(x), int(y)))
+
+
+def _draw_tile(canvas, box, officer, fonts, font_dir, emphasize=False,
+               img_dir=None, cache=TILE_CACHE):
+    """Paste one officer tile into `box` = (x, y, w, h) on canvas,
+    rendering it only when ``cache`` has no tile with the same
+    inputs.  Pass ``cache=None`` to bypass the cache."""
+    x, y, w, h = (int(v) for v in box)
+    canvas.paste(_cached_tile(w, h, officer, fonts, font_dir,
+                              emphasize=emphasize, img_dir=img_dir,
+                              cache=cache), (x, y))
 
 
 def _row_boxes(x0, x1, y, cell_h, count, gap):
@@ -306,20 +598,19 @@ def _fixed_row_boxes(canvas_w, y, count, tile_w, tile_h, gap):
             for i in range(count)]
 
 
-def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
-                         lodge_year, font_dir, dpi=150,
-                         width_in=47.0, height_in=29.0, img_dir=None):
-    """Build the poster and return single-page PDF bytes.
+def _poster_layout(officers, emblem_bytes, lodge_name, lodge_number,
+                   lodge_year, font_dir, dpi, width_in, height_in):
+    """Lay the poster out without allocating the canvas.
 
-    officers: list of dict(position_key, position_label, name, photo,
-    gender, is_vacated).
-    img_dir: absolute path to elkscontacts/static/img/ — used to load
-    the bundled Elks Male/Female avatar PNGs as a photo fallback.
+    Returns ``(W, H, ops, placements, fonts)`` in canvas pixels: ``ops``
+    are the header drawing operations (replayed by _apply_ops) and
+    ``placements`` the officer tiles as [(box, officer, emphasize)].
     """
     W = int(round(width_in * dpi))
     H = int(round(height_in * dpi))
-    canvas = Image.new('RGB', (W, H), BLACK)
-    draw = ImageDraw.Draw(canvas)
+    # Only used to measure text.
+    draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+    ops = []
 
     margin = int(W * 0.022)
     gap = int(W * 0.014)
@@ -329,6 +620,8 @@ def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
         # Smaller bold font for the "Position Vacant" caption on
         # vacated tiles — sized to fit inside the tile's dashed circle.
         'vacant': _load_font(font_dir, 'DejaVuSans-Bold.ttf', int(H * 0.03)),
+        # Tile pixel floors (_px) are tuned for 150 DPI.
+        'scale': dpi / 150.0,
     }
 
     # ---- index officers by position ----
@@ -356,27 +649,28 @@ def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
             emb = _contain_fit(emb, es, es)
             emb_y = int((header_h - es) / 2)
             pad = int(0.15 * dpi)
-            canvas.paste(emb, (margin + pad, emb_y))                 # left
-            canvas.paste(emb, (W - margin - pad - es, emb_y))        # right
+            ops.append(('paste', emb, (margin + pad, emb_y)))            # left
+            ops.append(('paste', emb, (W - margin - pad - es, emb_y)))   # right
     # Title centered
     title_text = (lodge_name or 'Lodge').upper() + ' OFFICERS'
     tfont = _fit_font(draw, title_text, 'DejaVuSans-Bold.ttf', font_dir,
-                      W - 2 * margin - int(header_h * 1.8), int(header_h * 0.42))
+                      W - 2 * margin - int(header_h * 1.8), int(header_h * 0.42),
+                      _px(fonts, 14))
     tw = draw.textlength(title_text, font=tfont)
     bbox = draw.textbbox((0, 0), title_text, font=tfont)
     th = bbox[3] - bbox[1]
     title_y = int(header_h * 0.20)
-    draw.text(((W - tw) / 2, title_y), title_text, fill=GOLD, font=tfont)
+    ops.append(('text', ((W - tw) / 2, title_y), title_text, GOLD, tfont))
     # Sub: lodge number + year
     sub = f"No. {lodge_number}    •    {lodge_year}"
     sfont = _load_font(font_dir, 'DejaVuSansCondensed-Bold.ttf', int(header_h * 0.20))
     sw = draw.textlength(sub, font=sfont)
-    draw.text(((W - sw) / 2, title_y + th + int(header_h * 0.16)), sub,
-              fill=WHITE, font=sfont)
+    ops.append(('text', ((W - sw) / 2, title_y + th + int(header_h * 0.16)),
+                sub, WHITE, sfont))
     # Gold rule under header
     rule_y = header_h
-    draw.rectangle([margin, rule_y, W - margin, rule_y + max(3, int(H * 0.0015))],
-                   fill=GOLD)
+    ops.append(('rect', (margin, rule_y, W - margin,
+                         rule_y + max(_px(fonts, 3), int(H * 0.0015))), GOLD))
 
     # ================= BODY GRID (hierarchical portrait tiles) ========
     # Tile sizes are scaled by rank, keeping the 3.5:6 portrait aspect.
@@ -436,6 +730,7 @@ def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
         bottom = bottom[:max_per_row]
         rows.append(bottom)
 
+    placements = []
     if rows:
         n_rows = len(rows)
         # --- Auto-enlarge to fill the sheet ('enlarge + spread') -------
@@ -476,24 +771,238 @@ def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
             for (officer, _scale), (tw, th) in zip(row, sizes):
                 # vertically center each tile within the row band
                 y = cur_y + (band_h - th) / 2.0
-                _draw_tile(canvas, (x, y, tw, th), officer, fonts,
-                           font_dir, img_dir=img_dir)
+                placements.append(((x, y, tw, th), officer, False))
                 x += tw + row_gap
             cur_y += band_h + vgap
 
-    # ================= EXPORT PDF + PREVIEW PNG =================
-    out = io.BytesIO()
-    canvas.save(out, format='PDF', resolution=float(dpi))
+    return W, H, ops, placements, fonts
+
+
+def poster_tile_sizes(position_keys, font_dir, dpi=150, width_in=47.0,
+                      height_in=29.0):
+    """Return ``{position_key: (w, h)}``, the pixel size of each
+    officer's tile at ``dpi``, from the layout alone (no photos, no
+    canvas) so callers can fetch photos no bigger than the tiles."""
+    _W, _H, _ops, placements, _fonts = _poster_layout(
+        [{'position_key': key} for key in position_keys], None, '', '', '',
+        font_dir, dpi=dpi, width_in=width_in, height_in=height_in)
+    return {officer['position_key']: (int(w), int(h))
+            for (_x, _y, w, h), officer, _emphasize in placements}
+
+
+def _apply_ops(target, ops, y0=0):
+    """Replay layout ``ops`` onto ``target``, whose top edge is canvas
+    row ``y0`` (0 for a full canvas, the band offset for a strip)."""
+    draw = ImageDraw.Draw(target)
+    for op in ops:
+        kind = op[0]
+        if kind == 'paste':
+            _kind, img, (x, y) = op
+            target.paste(img, (x, y - y0))
+        elif kind == 'text':
+            _kind, (x, y), text, fill, font = op
+            draw.text((x, y - y0), text, fill=fill, font=font)
+        elif kind == 'rect':
+            _kind, (x0, top, x1, bottom), fill = op
+            draw.rectangle([x0, top - y0, x1, bottom - y0], fill=fill)
+
+
+def _render_canvas(layout, font_dir, img_dir=None, cache=TILE_CACHE,
+                   workers=DEFAULT_WORKERS):
+    """Render a whole layout onto one canvas image."""
+    W, H, ops, placements, fonts = layout
+    canvas = Image.new('RGB', (W, H), BLACK)
+    _apply_ops(canvas, ops)
+    _draw_tiles(canvas, placements, fonts, font_dir, img_dir=img_dir,
+                cache=cache, workers=workers)
+    return canvas
+
+
+def _render_bands(layout, band_h, font_dir, img_dir=None, cache=TILE_CACHE,
+                  workers=DEFAULT_WORKERS):
+    """Yield the poster as ``(y0, strip)`` horizontal strips, top to
+    bottom.  Tiles are rendered when the first strip reaches them and
+    dropped once the strips have passed them, so with ``cache=None``
+    (what build_officer_poster uses for banded output) only one row of
+    tiles and one strip are in memory at a time; a cache keeps up to
+    its own limit on top of that."""
+    W, H, ops, placements, fonts = layout
+    pending = sorted(placements, key=lambda p: p[0][1])
+    live = []
+    for y0 in range(0, H, band_h):
+        y1 = min(H, y0 + band_h)
+        live = [(p, tile) for p, tile in live
+                if int(p[0][1]) + int(p[0][3]) > y0]
+        starting = []
+        while pending and int(pending[0][0][1]) < y1:
+            starting.append(pending.pop(0))
+        if starting:
+            live += zip(starting, _render_tiles(
+                starting, fonts, font_dir, img_dir=img_dir, cache=cache,
+                workers=workers))
+        band = Image.new('RGB', (W, y1 - y0), BLACK)
+        _apply_ops(band, ops, y0)
+        for ((x, y, _w, _h), _officer, _emphasize), tile in live:
+            band.paste(tile, (int(x), int(y) - y0))
+        yield y0, band
+
+
+def _write_image_pdf(out, pages, dpi, jpeg_quality=None):
+    """Write a PDF to ``out`` from ``pages``, an iterable of
+    ``(W, H, bands)`` where ``bands`` yields the ``(y0, strip)`` RGB
+    strips of one W x H px page at ``dpi``.  Each strip is JPEG-encoded
+    (as Pillow's own PDF writer does for RGB) and written out as soon as
+    it arrives, so neither a whole page nor the whole document ever
+    exists in memory.  Returns the number of pages written.
+    """
+    scale = 72.0 / dpi
+    # Objects 1 and 2 are the page tree and catalog, written last.
+    pages_num, catalog_num = 1, 2
+    offsets = {}
+    kids = []
+    save_opts = {'quality': jpeg_quality} if jpeg_quality else {}
+
+    def start_obj(num=None):
+        if num is None:
+            num = len(offsets) + 3
+        offsets[num] = out.tell()
+        out.write(b'%d 0 obj\n' % num)
+        return num
+
+    out.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    for W, H, bands in pages:
+        placed = []
+        for y0, band in bands:
+            jpeg = io.BytesIO()
+            band.save(jpeg, format='JPEG', **save_opts)
+            bw, bh = band.size
+            del band
+            num = start_obj()
+            out.write(b'<< /Type /XObject /Subtype /Image /Width %d '
+                      b'/Height %d /ColorSpace /DeviceRGB '
+                      b'/BitsPerComponent 8 /Filter /DCTDecode '
+                      b'/Length %d >>\nstream\n' % (bw, bh, jpeg.tell()))
+            out.write(jpeg.getbuffer())
+            out.write(b'\nendstream\nendobj\n')
+            placed.append((num, y0, bw, bh))
+
+        content = b''.join(
+            b'q %.4f 0 0 %.4f 0 %.4f cm /Im%d Do Q\n'
+            % (bw * scale, bh * scale, (H - y0 - bh) * scale, num)
+            for num, y0, bw, bh in placed)
+        content_num = start_obj()
+        out.write(b'<< /Length %d >>\nstream\n' % len(content))
+        out.write(content)
+        out.write(b'\nendstream\nendobj\n')
+
+        xobjects = b' '.join(b'/Im%d %d 0 R' % (num, num)
+                             for num, _y0, _bw, _bh in placed)
+        kids.append(start_obj())
+        out.write(b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.4f %.4f] '
+                  b'/Resources << /XObject << %s >> >> /Contents %d 0 R >>\n'
+                  b'endobj\n'
+                  % (pages_num, W * scale, H * scale, xobjects, content_num))
+
+    start_obj(pages_num)
+    out.write(b'<< /Type /Pages /Kids [%s] /Count %d >>\nendobj\n'
+              % (b' '.join(b'%d 0 R' % num for num in kids), len(kids)))
+    start_obj(catalog_num)
+    out.write(b'<< /Type /Catalog /Pages %d 0 R >>\nendobj\n' % pages_num)
+
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(offsets) + 1))
+    for num in range(1, len(offsets) + 1):
+        out.write(b'%010d 00000 n \n' % offsets[num])
+    out.write(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+              % (len(offsets) + 1, catalog_num, xref))
+    return len(kids)
 
-    # Downscaled PNG preview (keeps the wizard field light; faithful to
-    # the printed layout since it's the same canvas).
-    preview_w = 1600
-    preview_h = max(1, int(H * (preview_w / W)))
-    preview = canvas.resize((preview_w, preview_h), Image.LANCZOS)
-    pout = io.BytesIO()
-    preview.save(pout, format='PNG')
 
-    return out.getvalue(), pout.getvalue(), (W, H)
+def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
+                         lodge_year, font_dir, dpi=150,
+                         width_in=47.0, height_in=29.0, img_dir=None,
+                         workers=DEFAULT_WORKERS, cache=TILE_CACHE,
+                         banded=None):
+    """Build the poster and return single-page PDF bytes.
+
+    officers: list of dict(position_key, position_label, name, photo,
+    gender, is_vacated), optionally with photo_hash = a stable id of
+    the photo bytes (saves hashing them for the caches).
+    img_dir: absolute path to elkscontacts/static/img/ — used to load
+    the bundled Elks Male/Female avatar PNGs as a photo fallback.
+    workers: tile-rendering threads (1 = render serially).
+    cache: TileCache to reuse tiles from, or None to render every tile.
+    banded: render and encode the page in horizontal strips instead of
+    one canvas; None picks it automatically above MAX_CANVAS_PIXELS.
+    Banding is there to bound memory, so banded pages render their
+    full-size tiles without ``cache`` (or PHOTO_CACHE); the preview
+    still uses it.
+    """
+    args = (officers, emblem_bytes, lodge_name, lodge_number, lodge_year,
+            font_dir)
+    layout = _poster_layout(*args, dpi=dpi, width_in=width_in,
+                            height_in=height_in)
+    W, H = layout[0], layout[1]
+    if banded is None:
+        banded = W * H > MAX_CANVAS_PIXELS
+
+    # ================= EXPORT PDF =================
+    out = io.BytesIO()
+    if banded:
+        band_h = max(16, int(BAND_HEIGHT_IN * dpi) // 16 * 16)
+        # Caching full-size tiles and photos would keep up to the cache
+        # limits resident in the worker after the build.
+        _write_image_pdf(out, [(W, H, _render_bands(
+            layout, band_h, font_dir, img_dir=img_dir, cache=None,
+            workers=workers))], dpi)
+    else:
+        canvas = _render_canvas(layout, font_dir, img_dir=img_dir,
+                                cache=cache, workers=workers)
+        canvas.save(out, format='PDF', resolution=float(dpi))
+        del canvas
+
+    preview_png = _render_preview(args, min(dpi, PREVIEW_RENDER_DPI),
+                                  width_in, height_in, img_dir=img_dir,
+                                  cache=cache, workers=workers)
+    return out.getvalue(), preview_png, (W, H)
+
+
+def build_poster_proxy(officers, emblem_bytes, lodge_name, lodge_number,
+                       lodge_year, font_dir, width_in=47.0, height_in=29.0,
+                       img_dir=None, dpi=PROXY_DPI, workers=DEFAULT_WORKERS,
+                       cache=TILE_CACHE):
+    """Quick PNG proxy of the poster for setting it up interactively.
+
+    Same arguments as build_officer_poster (without the output options)
+    and the same _poster_layout, rendered at ``dpi`` (PROXY_DPI, about
+    940 x 580 px for the default size) and without building a PDF, so
+    it takes a fraction of a second.  Photos are decoded at
+    ``draft()`` scale and the small tiles stay in ``cache``.
+    """
+    args = (officers, emblem_bytes, lodge_name, lodge_number, lodge_year,
+            font_dir)
+    return _render_preview(args, dpi, width_in, height_in, img_dir=img_dir,
+                           cache=cache, workers=workers)
+
+
+def _render_preview(args, preview_dpi, width_in, height_in, img_dir=None,
+                    cache=TILE_CACHE, workers=DEFAULT_WORKERS):
+    """PNG preview of the poster for ``args`` = the leading positional
+    arguments of build_officer_poster.  Re-rendered from the same layout
+    at ``preview_dpi`` (keeps the wizard field light without ever
+    resizing the full-size canvas)."""
+    font_dir = args[-1]
+    small = _render_canvas(
+        _poster_layout(*args, dpi=preview_dpi, width_in=width_in,
+                       height_in=height_in),
+        font_dir, img_dir=img_dir, cache=cache, workers=workers)
+    preview_w = min(PREVIEW_WIDTH, small.width)
+    preview_h = max(1, int(small.height * (preview_w / small.width)))
+    if preview_w != small.width:
+        small = small.resize((preview_w, preview_h), Image.LANCZOS)
+    pout = io.BytesIO()
+    small.save(pout, format='PNG')
+    return pout.getvalue()
 
 
 # ----------------------------------------------------------------------
@@ -501,6 +1010,8 @@ def build_officer_poster(officers, emblem_bytes, lodge_name, lodge_number,
 # ----------------------------------------------------------------------
 if __name__ == '__main__':
     import random
+    import resource
+    import sys
 
     here = os.path.dirname(os.path.abspath(__file__))
     fdir = os.path.join(here, '..', 'static', 'fonts')
@@ -550,6 +1061,22 @@ if __name__ == '__main__':
     ed.text((150, 180), 'Elks', fill=(190, 60, 180))
     emb = io.BytesIO(); em.save(emb, 'PNG')
 
+    if sys.argv[1:2] == ['--rss']:
+        # Child process: one build, then report its peak RSS (MB).
+        build_officer_poster(
+            officers, emb.getvalue(), 'Lewiston Lodge', '896', '2025-2026',
+            fdir, dpi=int(sys.argv[2]), banded=sys.argv[3] == 'banded')
+        # VmHWM is this process's own high-water mark; ru_maxrss would
+        # include the parent's, inherited across fork().
+        try:
+            with open('/proc/self/status') as fh:
+                hwm_kb = next(int(line.split()[1]) for line in fh
+                              if line.startswith('VmHWM:'))
+        except (OSError, StopIteration):
+            hwm_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(hwm_kb // 1024)
+        sys.exit(0)
+
     pdf, preview_png, dims = build_officer_poster(
         officers, emb.getvalue(), 'Lewiston Lodge', '896', '2025-2026', fdir)
     with open('/tmp/officer_poster_test.pdf', 'wb') as f:
@@ -558,3 +1085,56 @@ if __name__ == '__main__':
         f.write(preview_png)
     print('wrote /tmp/officer_poster_test.pdf', dims, 'pdf_bytes=', len(pdf),
           'preview_bytes=', len(preview_png))
+
+    # ---- Benchmark: serial vs threaded tile rendering (cold cache) ----
+    import subprocess
+    import time
+
+    t0 = time.perf_counter()
+    proxy_png = build_poster_proxy(
+        officers, emb.getvalue(), 'Lewiston Lodge', '896', '2025-2026', fdir)
+    print('proxy @ %d DPI: %.3fs, %d bytes' % (
+        PROXY_DPI, time.perf_counter() - t0, len(proxy_png)))
+
+    print('benchmark (tile cache off, %d cpu)' % (os.cpu_count() or 1))
+    for bench_dpi in (150, 300):
+        for n_workers in (1, max(4, DEFAULT_WORKERS)):
+            PHOTO_CACHE.clear()
+            t0 = time.perf_counter()
+            build_officer_poster(
+                officers, emb.getvalue(), 'Lewiston Lodge', '896',
+                '2025-2026', fdir, dpi=bench_dpi,
+                workers=n_workers, cache=None)
+            print('  %3d DPI  workers=%-2d  %6.2fs' % (
+                bench_dpi, n_workers, time.perf_counter() - t0))
+
+    print('peak RSS per build (fresh process, default caches)')
+    for bench_dpi in (150, 300):
+        for mode in ('canvas', 'banded'):
+            rss = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--rss',
+                 str(bench_dpi), mode],
+                capture_output=True, text=True, check=True).stdout.split()[-1]
+            print('  %3d DPI  %-6s  %5s MB' % (bench_dpi, mode, rss))
+
+    # ---- Benchmark: full decode vs draft / reduce for phone photos ----
+    phone = Image.new('RGB', (3024, 4032), (70, 60, 110))
+    pd = ImageDraw.Draw(phone)
+    for _ in range(200):
+        pd.line([(random.randint(0, 3024), random.randint(0, 4032)),
+                 (random.randint(0, 3024), random.randint(0, 4032))],
+                fill=(200, 60, 60), width=12)
+    pb = io.BytesIO()
+    phone.save(pb, 'JPEG', quality=90)
+    phone_bytes = pb.getvalue()
+    del phone, pd
+    tile_w, tile_h = int(3.5 * 150), int(6.0 * 150)
+    print('30 x 12 MP JPEG photos -> %dx%d tiles' % (tile_w, tile_h))
+    for label, decode in (
+            ('full decode', lambda: _open_photo(phone_bytes)),
+            ('draft/reduce', lambda: _shrunk_photo(
+                phone_bytes, tile_w, tile_h, cache=None))):
+        t0 = time.perf_counter()
+        for _ in range(30):
+            _cover_crop(decode(), tile_w, tile_h)
+        print('  %-12s  %6.2fs' % (label, time.perf_counter() - t0))
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""Officer Photo Poster — vector PDF engine.
+
+Same layout as ``officer_poster_builder.build_officer_poster`` (it
+reuses ``_poster_layout`` and the tile geometry helpers), but drawn with
+ReportLab instead of onto one giant raster:
+
+* text, rules, frames, title bars and the vacancy graphic are vectors,
+  so they stay sharp at any print size;
+* each officer photo is embedded on its own as a JPEG, cover-cropped
+  and downsampled to its tile at ``dpi``;
+* the fonts are the bundled DejaVu TTFs, embedded as subsets.
+
+Like the raster builder this module has **no Odoo imports**.  ReportLab
+ships with Odoo; if it is missing, ``build_officer_poster_vector``
+raises ImportError and callers should fall back to the raster engine.
+"""
+import io
+
+from PIL import Image, ImageDraw
+
+from .officer_poster_builder import (
+    BAR_RGBA,
+    BLACK,
+    GOLD,
+    GOLD_BRIGHT,
+    PLACEHOLDER_BG,
+    PLACEHOLDER_FG,
+    PREVIEW_RENDER_DPI,
+    TILE_CACHE,
+    VACANT_BG,
+    VACANT_DASH,
+    VACANT_DASH_GAP,
+    VACANT_FG,
+    WHITE,
+    _cover_crop,
+    _load_avatar_bytes,
+    _placeholder_geometry,
+    _poster_layout,
+    _render_preview,
+    _shrunk_photo,
+    _tile_pad,
+    _title_bar_geometry,
+    _vacant_geometry,
+)
+
+try:
+    from reportlab import rl_config
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.pdfgen import canvas as rl_canvas
+except ImportError:
+    rl_canvas = None
+else:
+    # Embed stream data as binary rather than ASCII85 text.  ReportLab's
+    # ASCII85 encoder is pure Python (about 5 MB/s), which dominated the
+    # render time of a 300 DPI poster, and the text form is a quarter
+    # larger.  This is a process-wide ReportLab setting, set once here
+    # rather than swapped around each render (which would race with any
+    # other thread writing a PDF); binary streams are valid in every
+    # PDF reader, so other ReportLab output in the process is unaffected
+    # apart from being smaller.
+    rl_config.useA85 = 0
+
+#: JPEG quality of the embedded officer photos.
+PHOTO_JPEG_QUALITY = 80
+#: Used when a Pillow font has no TTF file behind it (load_default()).
+FALLBACK_FONT = 'Helvetica-Bold'
+
+
+def _rgb(color):
+    return tuple(c / 255.0 for c in color[:3])
+
+
+def _rl_font(font):
+    """Register the TTF behind a Pillow font with ReportLab (once) and
+    return ``(font_name, size)``."""
+    path = getattr(font, 'path', None)
+    size = getattr(font, 'size', 12)
+    if not isinstance(path, str):
+        return FALLBACK_FONT, size
+    name = path.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+    if name not in pdfmetrics.getRegisteredFontNames():
+        try:
+            pdfmetrics.registerFont(TTFont(name, path))
+        except Exception:
+            return FALLBACK_FONT, size
+    return name, size
+
+
+class _Page:
+    """ReportLab canvas addressed in poster pixels with Pillow's
+    conventions (origin top-left, y down, text placed by the top of its
+    ascender), so layout coordinates can be used unchanged."""
+
+    def __init__(self, out, W, H, dpi):
+        self.c = rl_canvas.Canvas(out, pagesize=(W * 72.0 / dpi,
+                                                 H * 72.0 / dpi),
+                                  pageCompression=1)
+        self.c.scale(72.0 / dpi, 72.0 / dpi)
+        # Height of each nested frame, in its own units.
+        self._heights = [H]
+
+    def push(self, x, y, sx=1.0, sy=1.0, h=None):
+        """Enter a frame whose top-left is (x, y) in the current frame
+        and which is ``h`` px tall before scaling by (sx, sy)."""
+        self.c.saveState()
+        self.c.translate(x, self._heights[-1] - y - h * sy)
+        self.c.scale(sx, sy)
+        self._heights.append(h)
+
+    def pop(self):
+        self._heights.pop()
+        self.c.restoreState()
+
+    def _y(self, y):
+        return self._heights[-1] - y
+
+    def rect(self, x, y, w, h, fill, alpha=None):
+        self.c.setFillColorRGB(*_rgb(fill))
+        if alpha is not None:
+            self.c.saveState()
+            self.c.setFillAlpha(alpha)
+        self.c.rect(x, self._y(y + h), w, h, stroke=0, fill=1)
+        if alpha is not None:
+            self.c.restoreState()
+
+    def text(self, xy, text, fill, font):
+        name, size = _rl_font(font)
+        ascent = font.getmetrics()[0] if hasattr(font, 'getmetrics') else size
+        self.c.setFillColorRGB(*_rgb(fill))
+        self.c.setFont(name, size)
+        self.c.drawString(xy[0], self._y(xy[1] + ascent), text)
+
+    def circle(self, cx, cy, r, color, width, dash=None):
+        """Stroke a circle whose *outer* edge has radius r, like
+        Pillow's ellipse / arc outlines."""
+        self.c.saveState()
+        self.c.setStrokeColorRGB(*_rgb(color))
+        self.c.setLineWidth(width)
+        if dash:
+            self.c.setDash(dash)
+        self.c.circle(cx, self._y(cy), r - width / 2.0, stroke=1, fill=0)
+        self.c.restoreState()
+
+    def line(self, points, color, width):
+        (x0, y0), (x1, y1) = points
+        self.c.setStrokeColorRGB(*_rgb(color))
+        self.c.setLineWidth(width)
+        self.c.line(x0, self._y(y0), x1, self._y(y1))
+
+    def image(self, img, x, y, w, h, jpeg_quality=None):
+        if jpeg_quality:
+            buf = io.BytesIO()
+            img.save(buf, format='JPEG', quality=jpeg_quality)
+            buf.seek(0)
+            img = buf
+        self.c.drawImage(ImageReader(img), x, self._y(y + h), w, h)
+
+
+def _draw_vacant(page, draw, w, h, fonts, font_dir):
+    g = _vacant_geometry(draw, w, h, fonts, font_dir)
+    page.rect(0, 0, w, h, VACANT_BG)
+    r = g['r']
+    # Dash / gap lengths along the stroke's centre line.
+    mid = r - g['stroke'] / 2.0
+    page.circle(g['cx'], g['cy'], r, VACANT_FG, g['stroke'], dash=[
+        mid * VACANT_DASH * 3.14159 / 180,
+        mid * VACANT_DASH_GAP * 3.14159 / 180,
+    ])
+    for line in g['x_lines']:
+        page.line(line, VACANT_FG, g['stroke'])
+    page.text(g['caption_xy'], g['caption'], VACANT_FG, g['font'])
+
+
+def _draw_placeholder(page, draw, w, h, name, fonts):
+    g = _placeholder_geometry(draw, w, h, name, fonts)
+    page.rect(0, 0, w, h, PLACEHOLDER_BG)
+    page.circle(g['cx'], g['cy'], g['r'], PLACEHOLDER_FG, g['stroke'])
+    page.text(g['text_xy'], g['text'], PLACEHOLDER_FG, g['font'])
+
+
+def _draw_vector_tile(page, draw, box, officer, fonts, font_dir,
+                      emphasize=False, img_dir=None):
+    """Vector counterpart of officer_poster_builder._render_tile."""
+    x, y, w, h = (int(v) for v in box)
+    name = officer.get('name') or ''
+    title = officer.get('position_label') or ''
+    pad = _tile_pad(w, h, fonts)
+    inner_w, inner_h = w - 2 * pad, h - 2 * pad
+
+    page.push(x, y, h=h)
+    page.rect(0, 0, w, h, GOLD)
+
+    photo = None
+    if not officer.get('is_vacated'):
+        photo = _shrunk_photo(officer.get('photo'), w, h,
+                              key=officer.get('photo_hash'))
+        if photo is None:
+            photo = _shrunk_photo(
+                _load_avatar_bytes(img_dir, officer.get('gender')), w, h)
+    if photo is not None:
+        # Same crop as the raster tile: cover w x h, then fit the frame.
+        crop = _cover_crop(photo, w, h).resize((inner_w, inner_h),
+                                               Image.LANCZOS)
+        page.image(crop, pad, pad, inner_w, inner_h,
+                   jpeg_quality=PHOTO_JPEG_QUALITY)
+    else:
+        # The raster tile draws these at w x h and shrinks them into
+        # the frame; scale the vector drawing the same way.
+        page.push(pad, pad, inner_w / w, inner_h / h, h=h)
+        if officer.get('is_vacated'):
+            _draw_vacant(page, draw, w, h, fonts, font_dir)
+        else:
+            _draw_placeholder(page, draw, w, h, name, fonts)
+        page.pop()
+
+    bar = _title_bar_geometry(draw, w, h, name, title, fonts, font_dir,
+                              emphasize)
+    page.rect(0, h - bar['bar_h'], w, bar['bar_h'], BAR_RGBA,
+              alpha=BAR_RGBA[3] / 255.0)
+    page.text(bar['name_xy'], name, GOLD_BRIGHT, bar['name_font'])
+    page.text(bar['title_xy'], title, WHITE, bar['title_font'])
+    page.pop()
+
+
+def _draw_poster(out, W, H, dpi, ops, placements, fonts, font_dir, img_dir):
+    # Only used to measure text.
+    draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+    page = _Page(out, W, H, dpi)
+    page.rect(0, 0, W, H, BLACK)
+    for op in ops:
+        kind = op[0]
+        if kind == 'paste':
+            _kind, img, (x, y) = op
+            page.image(img, x, y, img.width, img.height)
+        elif kind == 'text':
+            _kind, xy, text, fill, font = op
+            page.text(xy, text, fill, font)
+        elif kind == 'rect':
+            _kind, (x0, top, x1, bottom), fill = op
+            # Pillow rectangles include both end pixels.
+            page.rect(x0, top, x1 - x0 + 1, bottom - top + 1, fill)
+    for box, officer, emphasize in placements:
+        _draw_vector_tile(page, draw, box, officer, fonts, font_dir,
+                          emphasize=emphasize, img_dir=img_dir)
+    page.c.showPage()
+    page.c.save()
+
+
+def build_officer_poster_vector(officers, emblem_bytes, lodge_name,
+                                lodge_number, lodge_year, font_dir, dpi=150,
+                                width_in=47.0, height_in=29.0, img_dir=None,
+                                cache=TILE_CACHE):
+    """Build the poster as a vector PDF.  Same arguments and return
+    value as build_officer_poster; ``dpi`` only sets the resolution of
+    the embedded photos (and the preview's layout)."""
+    if rl_canvas is None:
+        raise ImportError("ReportLab is required for the vector poster.")
+    args = (officers, emblem_bytes, lodge_name, lodge_number, lodge_year,
+            font_dir)
+    W, H, ops, placements, fonts = _poster_layout(
+        *args, dpi=dpi, width_in=width_in, height_in=height_in)
+
+    out = io.BytesIO()
+    _draw_poster(out, W, H, dpi, ops, placements, fonts, font_dir, img_dir)
+
+    preview_png = _render_preview(args, min(dpi, PREVIEW_RENDER_DPI),
+                                  width_in, height_in, img_dir=img_dir,
+                                  cache=cache)
+    return out.getvalue(), preview_png, (W, H)
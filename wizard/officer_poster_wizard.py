@@ -2,9 +2,15 @@
 """Officer Photo Poster wizard.
 
 Collects the lodge officers for a chosen lodge year, builds a large-format
-(default 47" x 29" @ 150 DPI) photo-board PDF via the pure-Pillow
-``officer_poster_builder`` module, and hands back a print-ready PDF plus
-ready-to-send instructions for a print shop (Staples).
+(default 47" x 29" @ 150 DPI) photo-board PDF — vector text and graphics
+via ``officer_poster_vector`` (ReportLab), or one image via the
+pure-Pillow ``officer_poster_builder`` — and hands back a print-ready PDF plus
+ready-to-send instructions for a print shop (Staples).  While the
+poster is being set up, a low-DPI proxy of the same layout is rendered
+on every change, so the full-resolution render only runs for
+"Generate Final".  Large posters
+can instead be queued as an ``elks.officer.poster.job`` and rendered by
+a background cron worker.
 """
 import base64
 import os
@@ -12,12 +18,14 @@ import os
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
 
+from ..models.elks_officer_poster_job import OUTPUT_ENGINES
 from ..models.elks_officer_term import (
     OFFICER_POSITIONS,
     _lodge_year_selections,
     _default_lodge_year,
 )
 from . import officer_poster_builder as builder
+from . import officer_poster_vector as vector_builder
 
 _IMG_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), '..', 'static', 'img')
@@ -25,6 +33,19 @@ _IMG_DIR = os.path.abspath(
 _FONT_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), '..', 'static', 'fonts')
 )
+#: Stored photo derivatives (image_<size>) on terms and contacts,
+#: smallest first; the last is the original.
+PHOTO_SIZES = (512, 1024, 1920)
+#: Stored photo derivative read for the layout proxy.
+PROXY_PHOTO_SIZE = 512
+
+
+def _photo_size_for(tile):
+    """Smallest stored derivative whose long side covers a (w, h)
+    tile; the 1920px original only when the tile needs it."""
+    need = max(tile) if tile else PHOTO_SIZES[-1]
+    return next((size for size in PHOTO_SIZES if size >= need),
+                PHOTO_SIZES[-1])
 
 
 class ElksOfficerPosterWizard(models.TransientModel):
@@ -49,14 +70,22 @@ class ElksOfficerPosterWizard(models.TransientModel):
         "Include Archived Terms", default=False,
         help="Normally only active officer terms are shown.",
     )
+    output_engine = fields.Selection(
+        OUTPUT_ENGINES, string="PDF Output", default='vector',
+        required=True,
+        help="Vector: text, frames and graphics stay sharp at any size "
+             "and only the photos are images (smaller, faster). "
+             "Raster: the whole poster is one image at the chosen DPI.",
+    )
 
     # Results
     poster_pdf = fields.Binary("Poster PDF", readonly=True, attachment=True)
     poster_filename = fields.Char("Filename", readonly=True)
     poster_preview = fields.Binary(
         "Preview", readonly=True, attachment=True,
-        help="On-screen preview of the generated poster (downscaled). "
-             "The downloaded PDF is full resolution.",
+        help="On-screen preview of the poster: a quick low-resolution "
+             "proxy while setting it up, then a downscaled copy of the "
+             "generated poster. The downloaded PDF is full resolution.",
     )
     officer_count = fields.Integer("Officers Found", readonly=True)
     staples_instructions = fields.Text("Print Shop Instructions", readonly=True)
@@ -66,8 +95,9 @@ class ElksOfficerPosterWizard(models.TransientModel):
     )
 
     # ------------------------------------------------------------------
-    def _collect_officers(self):
-        """Return an ordered list of officer dicts for the builder."""
+    def _officer_terms(self):
+        """Return the officer terms of the lodge year, one per position
+        (duplicate partial-year extras skipped), in position order."""
         self.ensure_one()
         Term = self.env['elks.officer.term']
         domain = [('lodge_year', '=', self.lodge_year)]
@@ -75,47 +105,73 @@ class ElksOfficerPosterWizard(models.TransientModel):
             domain.append(('active', '=', True))
         terms = Term.with_context(active_test=not self.include_inactive).search(domain)
 
-        labels = dict(OFFICER_POSITIONS)
         # Position display order for "the rest" row stability.
         order_index = {key: i for i, (key, _lbl) in enumerate(OFFICER_POSITIONS)}
 
-        officers = []
+        firsts = Term
         seen = set()
         for term in terms:
             # one tile per position (skip duplicate partial-year extras)
             if term.position in seen:
                 continue
             seen.add(term.position)
+            firsts |= term
+        return firsts.sorted(lambda t: order_index.get(t.position, 999))
 
-            # Vacated terms are rendered as "Position Vacant" tiles —
-            # we skip loading the officer's photo since the tile will
-            # show a placeholder icon + "Position Vacant" text (same
-            # treatment as the public website officer page).
-            is_vacated = bool(getattr(term, 'x_is_vacated', False))
-            photo_bytes = None
-            if not is_vacated:
-                photo = (term.image_1920
-                         or term.partner_id.image_1920
-                         or False)
-                photo_bytes = base64.b64decode(photo) if photo else None
-
-            officers.append({
-                'position_key': term.position,
-                'position_label': labels.get(term.position, term.position or ''),
-                # Vacated tiles hide the officer's name — only the
-                # position label appears — so the printed poster
-                # reads "Position Vacant / <Position>" instead of
-                # advertising who resigned.
-                'name': ('' if is_vacated
-                         else (term.partner_id.name or '')),
-                'photo': photo_bytes,
-                'gender': term.gender or 'male',
-                'is_vacated': is_vacated,
-                '_order': order_index.get(term.position, 999),
-            })
-
-        officers.sort(key=lambda o: o['_order'])
-        return officers
+    def _officer_entry(self, term, photo_size=1920):
+        """Officer dict for the builders from one officer term, with the
+        stored ``image_<photo_size>`` derivative of its photo (term
+        photo first, then the member's contact photo).  Falls back to
+        the original when a derivative hasn't been stored."""
+        labels = dict(OFFICER_POSITIONS)
+        field = 'image_%d' % photo_size
+        # Vacated terms are rendered as "Position Vacant" tiles —
+        # we skip loading the officer's photo since the tile will
+        # show a placeholder icon + "Position Vacant" text (same
+        # treatment as the public website officer page).
+        is_vacated = bool(getattr(term, 'x_is_vacated', False))
+        photo_bytes = photo_hash = None
+        if not is_vacated:
+            if term.image_checksum:
+                photo = term[field]
+                if not photo:
+                    photo, photo_size = term.image_1920, 1920
+                # Derivatives of one photo differ, so key on both.
+                photo_hash = '%s/%d' % (term.image_checksum, photo_size)
+            else:
+                photo = (term.partner_id[field]
+                         or term.partner_id.image_1920)
+            photo_bytes = base64.b64decode(photo) if photo else None
+
+        return {
+            'position_key': term.position,
+            'position_label': labels.get(term.position, term.position or ''),
+            # Vacated tiles hide the officer's name — only the
+            # position label appears — so the printed poster
+            # reads "Position Vacant / <Position>" instead of
+            # advertising who resigned.
+            'name': ('' if is_vacated
+                     else (term.partner_id.name or '')),
+            'photo': photo_bytes,
+            'photo_hash': photo_hash,
+            'gender': term.gender or 'male',
+            'is_vacated': is_vacated,
+        }
+
+    def _collect_officers(self, photo_size=None):
+        """Return an ordered list of officer dicts for the builder.
+        Without ``photo_size`` each photo is read at the smallest stored
+        derivative that covers its tile at the poster's DPI."""
+        terms = self._officer_terms()
+        if photo_size:
+            return [self._officer_entry(term, photo_size) for term in terms]
+        tiles = builder.poster_tile_sizes(
+            terms.mapped('position'), _FONT_DIR, dpi=self.dpi,
+            width_in=self.width_in, height_in=self.height_in)
+        return [
+            self._officer_entry(term, _photo_size_for(tiles.get(term.position)))
+            for term in terms
+        ]
 
     def _emblem_bytes(self):
         settings = self.env['elks.lodge.settings'].sudo().search([], limit=1)
@@ -163,13 +219,66 @@ class ElksOfficerPosterWizard(models.TransientModel):
         }
 
     # ------------------------------------------------------------------
-    def action_generate(self):
-        self.ensure_one()
+    def _check_poster_params(self):
         if self.dpi < 72 or self.dpi > 300:
             raise UserError(_(
                 "Please choose a DPI between 72 and 300. 150 is recommended "
                 "for large-format posters."
             ))
+
+    @api.onchange('lodge_year', 'width_in', 'height_in', 'include_inactive')
+    def _onchange_proxy_preview(self):
+        """Re-render the quick layout proxy as the poster is set up."""
+        if self.state == 'done':
+            return
+        self.poster_preview = self._render_proxy()
+
+    def _render_proxy(self):
+        """Base64 PNG of the poster at builder.PROXY_DPI, or False when
+        there is nothing to lay out yet."""
+        if not (self.lodge_year and 0 < self.width_in <= 200
+                and 0 < self.height_in <= 200):
+            return False
+        officers = self._collect_officers(PROXY_PHOTO_SIZE)
+        if not officers:
+            return False
+        emblem, lodge_name, lodge_number = self._emblem_bytes()
+        png = builder.build_poster_proxy(
+            officers=officers,
+            emblem_bytes=emblem,
+            lodge_name=lodge_name,
+            lodge_number=lodge_number,
+            lodge_year=self.lodge_year,
+            font_dir=_FONT_DIR,
+            img_dir=_IMG_DIR,
+            width_in=self.width_in,
+            height_in=self.height_in,
+        )
+        return base64.b64encode(png)
+
+    def action_preview(self):
+        """Refresh the proxy (e.g. after editing officer terms)."""
+        self.ensure_one()
+        self.write({
+            'poster_preview': self._render_proxy(),
+            'state': 'draft',
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+            'context': self.env.context,
+        }
+
+    def _render_poster(self):
+        """Collect the officers and build the poster.  Returns a dict
+        with the raw ``pdf`` and ``preview`` bytes, ``filename``,
+        ``officer_count`` and ``staples_instructions``; used both here
+        and by elks.officer.poster.job in the background."""
+        self.ensure_one()
+        self._check_poster_params()
         officers = self._collect_officers()
         if not officers:
             raise UserError(_(
@@ -179,7 +288,11 @@ class ElksOfficerPosterWizard(models.TransientModel):
 
         emblem, lodge_name, lodge_number = self._emblem_bytes()
 
-        pdf_bytes, preview_png, _dims = builder.build_officer_poster(
+        if self.output_engine == 'vector' and vector_builder.rl_canvas:
+            build = vector_builder.build_officer_poster_vector
+        else:
+            build = builder.build_officer_poster
+        pdf_bytes, preview_png, _dims = build(
             officers=officers,
             emblem_bytes=emblem,
             lodge_name=lodge_name,
@@ -196,13 +309,24 @@ class ElksOfficerPosterWizard(models.TransientModel):
             (lodge_number or 'lodge'),
             (self.lodge_year or '').replace('/', '-'),
         )
-        self.write({
-            'poster_pdf': base64.b64encode(pdf_bytes),
-            'poster_preview': base64.b64encode(preview_png),
-            'poster_filename': fname,
+        return {
+            'pdf': pdf_bytes,
+            'preview': preview_png,
+            'filename': fname,
             'officer_count': len(officers),
             'staples_instructions': self._build_staples_instructions(
                 lodge_name, lodge_number),
+        }
+
+    def action_generate(self):
+        self.ensure_one()
+        result = self._render_poster()
+        self.write({
+            'poster_pdf': base64.b64encode(result['pdf']),
+            'poster_preview': base64.b64encode(result['preview']),
+            'poster_filename': result['filename'],
+            'officer_count': result['officer_count'],
+            'staples_instructions': result['staples_instructions'],
             'state': 'done',
         })
         return {
@@ -213,3 +337,32 @@ class ElksOfficerPosterWizard(models.TransientModel):
             'target': 'new',
             'context': self.env.context,
         }
+
+    def action_generate_background(self):
+        """Queue the poster for the background worker instead of
+        rendering it inside this request (large / 300 DPI posters)."""
+        self.ensure_one()
+        self._check_poster_params()
+        job = self.env['elks.officer.poster.job'].create({
+            'lodge_year': self.lodge_year,
+            'width_in': self.width_in,
+            'height_in': self.height_in,
+            'dpi': self.dpi,
+            'include_inactive': self.include_inactive,
+            'output_engine': self.output_engine,
+        })
+        job._trigger_worker()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Officer Poster Queued'),
+                'message': _(
+                    'The %(yr)s poster is being generated in the background. '
+                    'You will be notified in Discuss when it is ready to '
+                    'download from Officer Poster Jobs.'
+                ) % {'yr': self.lodge_year},
+                'type': 'info',
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
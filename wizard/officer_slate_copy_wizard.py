@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""Copy Officer Slate wizard.
+
+Clones one lodge year's officer terms into another lodge year so the
+Secretary doesn't have to re-enter the whole slate every April.  The
+new terms are built in memory and written with a single batched
+``create`` — the overlap / duplicate constraints on elks.officer.term
+are set-based, so the whole slate is validated once at the end.
+
+Optionally advances the chairs: Lecturing Knight -> Loyal Knight ->
+Leading Knight -> Exalted Ruler.  The outgoing Exalted Ruler is not
+carried forward and the Lecturing Knight chair is left open for the
+new election.
+"""
+from datetime import date
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+
+from ..models.elks_lodge_year import (
+    current_lodge_year,
+    next_lodge_year_label,
+)
+from ..models.elks_officer_term import _term_lodge_year_selections
+
+#: Chair progression when advancing the slate (from -> to).  Mapping a
+#: chair to False drops it from the copied slate.
+CHAIR_ADVANCEMENT = {
+    'lecturing_knight': 'loyal_knight',
+    'loyal_knight': 'leading_knight',
+    'leading_knight': 'exalted_ruler',
+    'exalted_ruler': False,
+}
+
+#: Fields that follow the member onto the new term.
+MEMBER_FIELDS = ('image_1920', 'gender', 'message', 'show_on_website')
+#: Fields that belong to the seat (e.g. ER@lodge.com) and stay with the
+#: position when chairs advance.
+SEAT_FIELDS = ('officer_email', 'officer_phone')
+
+
+class ElksOfficerSlateCopyWizard(models.TransientModel):
+    _name = 'elks.officer.slate.copy.wizard'
+    _description = 'Copy Officer Slate to Next Lodge Year'
+
+    source_year = fields.Selection(
+        selection=_term_lodge_year_selections, string='Copy From',
+        required=True,
+        default=lambda self: current_lodge_year(
+            fields.Date.context_today(self)),
+    )
+    target_year = fields.Selection(
+        selection=_term_lodge_year_selections, string='Copy To',
+        required=True,
+        default=lambda self: next_lodge_year_label(current_lodge_year(
+            fields.Date.context_today(self))),
+    )
+    term_ids = fields.Many2many(
+        'elks.officer.term', string='Terms to Copy',
+        help="Leave empty to copy every current (active, non-vacated) "
+             "term of the source year.",
+    )
+    advance_chairs = fields.Boolean(
+        'Advance the Chairs',
+        help="Move Lecturing Knight -> Loyal Knight -> Leading Knight -> "
+             "Exalted Ruler.  The outgoing Exalted Ruler is not copied and "
+             "the Lecturing Knight chair is left open.",
+    )
+    skip_honorifics = fields.Boolean(
+        'Skip Honorifics', default=True,
+        help="Don't copy yearly honors (PER of the Year, Elk of the Year, "
+             "...) — they are awarded again each year.",
+    )
+
+    @api.model
+    def default_get(self, fields_list):
+        res = super().default_get(fields_list)
+        ctx = self.env.context
+        if ctx.get('active_model') == 'elks.officer.term' \
+                and ctx.get('active_ids'):
+            terms = self.env['elks.officer.term'].browse(ctx['active_ids'])
+            res['term_ids'] = [(6, 0, terms.ids)]
+            years = set(terms.mapped('lodge_year'))
+            if len(years) == 1:
+                year = years.pop()
+                res['source_year'] = year
+                res['target_year'] = next_lodge_year_label(year)
+        return res
+
+    @api.onchange('source_year')
+    def _onchange_source_year(self):
+        if self.source_year:
+            self.target_year = next_lodge_year_label(self.source_year)
+
+    def _source_terms(self):
+        """Current terms of the source year, one holder per position
+        (the latest-starting one when a seat changed hands mid-year)."""
+        Term = self.env['elks.officer.term']
+        if self.term_ids:
+            terms = self.term_ids.filtered(
+                lambda t: t.active and not t.x_is_vacated
+                and t.lodge_year == self.source_year)
+        else:
+            terms = Term.search([
+                ('lodge_year', '=', self.source_year),
+                ('active', '=', True),
+                ('x_is_vacated', '=', False),
+            ])
+        if self.skip_honorifics:
+            terms = terms.filtered(lambda t: t.officer_type != 'honorific')
+        by_position = {}
+        for term in terms.sorted(lambda t: (t.date_start or date.min, t.id)):
+            by_position[term.position] = term
+        return by_position
+
+    def action_copy_slate(self):
+        self.ensure_one()
+        if self.source_year == self.target_year:
+            raise UserError(_(
+                "Choose a different lodge year to copy the slate into."
+            ))
+        by_position = self._source_terms()
+        if not by_position:
+            raise UserError(_(
+                "No current officer terms found for lodge year %s."
+            ) % self.source_year)
+
+        Term = self.env['elks.officer.term']
+        existing = {
+            (t.partner_id.id, t.position)
+            for t in Term.search([
+                ('lodge_year', '=', self.target_year),
+                ('active', '=', True),
+            ])
+        }
+
+        vals_list = []
+        skipped = 0
+        for position, term in by_position.items():
+            new_position = position
+            if self.advance_chairs and position in CHAIR_ADVANCEMENT:
+                new_position = CHAIR_ADVANCEMENT[position]
+                if not new_position:
+                    continue
+            if (term.partner_id.id, new_position) in existing:
+                skipped += 1
+                continue
+            vals = {
+                'partner_id': term.partner_id.id,
+                'position': new_position,
+                'lodge_year': self.target_year,
+            }
+            if new_position == position:
+                # Keep a manual override (e.g. appointed -> elected);
+                # advanced chairs get the type computed from the new
+                # position.
+                vals['officer_type'] = term.officer_type
+            for fname in MEMBER_FIELDS:
+                vals[fname] = term[fname]
+            seat = by_position.get(new_position)
+            for fname in SEAT_FIELDS:
+                vals[fname] = seat[fname] if seat else False
+            vals_list.append(vals)
+
+        new_terms = Term.create(vals_list)
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Officer Slate %(yr)s (%(n)s copied, %(s)s skipped)') % {
+                'yr': self.target_year,
+                'n': len(new_terms),
+                's': skipped,
+            },
+            'res_model': 'elks.officer.term',
+            'view_mode': 'list,form',
+            'domain': [('lodge_year', '=', self.target_year)],
+        }